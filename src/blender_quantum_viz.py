@@ -3,6 +3,7 @@
 
 import bpy
 import json
+import os
 import numpy as np
 import argparse
 
@@ -13,10 +14,20 @@ def clear_scene():
     bpy.ops.object.delete(use_global=False)
 
 
-def create_quantum_state_visualization(data_file, frames=100):
-    # Load quantum state data from JSON file
+def load_quantum_state(data_file):
+    # Read the JSON header and memory-map the raw psi array it points to
     with open(data_file, 'r') as f:
-        data = json.load(f)
+        header = json.load(f)
+    psi_file = os.path.join(os.path.dirname(data_file), header['psi_file'])
+    psi = np.load(psi_file, mmap_mode='r')
+    return psi, np.array(header['x']), np.array(header['y']), np.array(header['z'])
+
+
+def create_quantum_state_visualization(data_file, frames=100):
+    psi, x, y, z = load_quantum_state(data_file)
+    X, Y, Z = np.meshgrid(x, y, z)
+    positions = np.column_stack((X.ravel(), Y.ravel(), Z.ravel()))
+    amplitudes = np.abs(psi).ravel()
 
     # Create a new material with emission shader for visualization
     mat = bpy.data.materials.new(name="QuantumMaterial")
@@ -47,11 +58,11 @@ def create_quantum_state_visualization(data_file, frames=100):
     for frame in range(1, frames + 1):
         bpy.context.scene.frame_set(frame)
 
-        for i, value in enumerate(data['psi']):
+        scale = 0.5 * (1 + np.sin(frame / 10))  # Animate radius
+        for position, value in zip(positions, amplitudes):
             element = meta_obj.data.elements.new()
-            element.co = (data['x'][i], data['y'][i], data['z'][i])
-            element.radius = abs(value) * 0.5 * \
-                (1 + np.sin(frame / 10))  # Animate radius
+            element.co = position
+            element.radius = value * scale
             element.keyframe_insert(data_path="radius", frame=frame)
 
     # Set up camera and lighting for better quality
@@ -0,0 +1,151 @@
+import collections
+import numpy as np
+
+# Array axis of each coordinate in the np.meshgrid(x, y, z) layout (y, x, z)
+GRID_AXES = {'x': 1, 'y': 0, 'z': 2}
+BIPARTITIONS = ['x|yz', 'y|xz', 'z|xy']
+
+
+def bipartite_matrix(psi, bipartition='x|yz'):
+    """Reshape psi into the (subsystem A, subsystem B) coefficient matrix
+
+    3D states are split along one grid coordinate, e.g. 'x|yz'. Flat states
+    (such as qubit registers) are split into the two most balanced factors
+    of their length. No copy is made when the axes are already in order.
+    """
+    psi = np.asarray(psi)
+    if psi.ndim == 1:
+        d = int(np.sqrt(psi.size))
+        while psi.size % d:
+            d -= 1
+        return psi.reshape(d, psi.size // d)
+    axis = GRID_AXES[bipartition.split('|')[0]]
+    moved = np.moveaxis(psi, axis, 0)
+    return moved.reshape(moved.shape[0], -1)
+
+
+def schmidt_coefficients(psi, bipartition='x|yz'):
+    """Schmidt coefficients of the normalized state, in descending order"""
+    M = bipartite_matrix(psi, bipartition)
+    s = np.linalg.svd(M, compute_uv=False)
+    return s / np.linalg.norm(s)
+
+
+def schmidt_decomposition(psi, bipartition='x|yz', rank=None):
+    """Return (coefficients, A vectors as columns, B vectors as rows)
+
+    Truncates to the leading `rank` terms when given.
+    """
+    M = bipartite_matrix(psi, bipartition)
+    U, s, Vh = np.linalg.svd(M, full_matrices=False)
+    norm = np.linalg.norm(s)
+    if rank is not None:
+        U, s, Vh = U[:, :rank], s[:rank], Vh[:rank]
+    return s / norm, U, Vh
+
+
+def entanglement_entropy(psi, bipartition='x|yz', base=2):
+    """Von Neumann entropy of the reduced state, from Schmidt coefficients"""
+    p = schmidt_coefficients(psi, bipartition)**2
+    p = p[p > 1e-15]
+    return max(0.0, -np.sum(p * np.log(p)) / np.log(base))
+
+
+def reduced_density_matrix(psi, bipartition='x|yz'):
+    """rho_A = Tr_B |psi><psi|, an (n_A x n_A) matrix"""
+    M = bipartite_matrix(psi, bipartition)
+    rho = M @ M.conj().T
+    return rho / np.trace(rho).real
+
+
+class DensityMatrixTiles:
+    """Level-of-detail tiles of |rho| for rho = F F^dagger given the factor F
+
+    F is (N x r): one normalized column for a pure state, sqrt(w_k) v_k
+    columns for a mixture. Level 0 is |rho| itself. Level L > 0 shows the
+    mean of |rho| over 2^L x 2^L blocks via block means of |F|: for a pure
+    state |rho_ij| = |F_i| |F_j|, so this is exact; for a mixture it is the
+    block mean of sum_k |F_ik| |F_jk|, an upper bound on |rho|. Phases never
+    cancel inside a block. A tile costs O(tile^2 r) at any zoom and the
+    N x N matrix is never formed. Tiles live in a small LRU cache.
+    """
+
+    def __init__(self, factor, tile_size=256, cache_size=64):
+        self.factor = np.asarray(factor).reshape(len(factor), -1)
+        self.size = self.factor.shape[0]
+        self.tile_size = tile_size
+        self.cache_size = cache_size
+        self._levels = {0: self.factor}
+        self._tiles = collections.OrderedDict()
+
+    @classmethod
+    def from_state(cls, psi, **kwargs):
+        psi = np.ravel(psi)
+        return cls(psi[:, None] / np.linalg.norm(psi), **kwargs)
+
+    @classmethod
+    def from_mixture(cls, states, weights, **kwargs):
+        states = np.stack([np.ravel(s) / np.linalg.norm(s) for s in states],
+                          axis=1)
+        weights = np.asarray(weights, dtype=float)
+        return cls(states * np.sqrt(weights / weights.sum()), **kwargs)
+
+    def level_factor(self, level):
+        """Factor with one row per 2^level matrix rows
+
+        Level 0 is F; higher levels hold block means of |F|.
+        """
+        if level not in self._levels:
+            block = 2**level
+            starts = np.arange(0, self.size, block)
+            counts = np.minimum(block, self.size - starts)
+            self._levels[level] = np.add.reduceat(
+                np.abs(self.factor), starts, axis=0) / counts[:, None]
+        return self._levels[level]
+
+    def tile(self, level, row, col):
+        """|rho| tile (row, col) at the given level, from the LRU cache"""
+        key = (level, row, col)
+        if key in self._tiles:
+            self._tiles.move_to_end(key)
+            return self._tiles[key]
+        F = self.level_factor(level)
+        t = self.tile_size
+        rows = F[row * t:(row + 1) * t]
+        cols = F[col * t:(col + 1) * t]
+        if level == 0:
+            tile = np.abs(rows @ cols.conj().T)
+        else:
+            tile = rows @ cols.T  # non-negative block means of |F|
+        tile = tile.astype(np.float32)
+        self._tiles[key] = tile
+        if len(self._tiles) > self.cache_size:
+            self._tiles.popitem(last=False)
+        return tile
+
+    def render(self, row_range, col_range, shape):
+        """Render the viewport at roughly `shape` (height, width) pixels
+
+        Returns (image, (row0, col0), scale): image pixel (i, j) covers matrix
+        rows row0 + i * scale and columns col0 + j * scale onwards.
+        """
+        row0, row1 = (int(np.clip(v, 0, self.size)) for v in row_range)
+        col0, col1 = (int(np.clip(v, 0, self.size)) for v in col_range)
+        density = max((row1 - row0) / max(shape[0], 1),
+                      (col1 - col0) / max(shape[1], 1), 1)
+        level = int(np.floor(np.log2(density)))
+        scale = 2**level
+        n = len(self.level_factor(level))
+        r0, r1 = row0 // scale, min(-(-row1 // scale), n)
+        c0, c1 = col0 // scale, min(-(-col1 // scale), n)
+        image = np.zeros((max(r1 - r0, 0), max(c1 - c0, 0)), dtype=np.float32)
+        t = self.tile_size
+        for ti in range(r0 // t, -(-r1 // t)):
+            for tj in range(c0 // t, -(-c1 // t)):
+                tile = self.tile(level, ti, tj)
+                rs, cs = max(ti * t, r0), max(tj * t, c0)
+                re = min(ti * t + tile.shape[0], r1)
+                ce = min(tj * t + tile.shape[1], c1)
+                image[rs - r0:re - r0, cs - c0:ce - c0] = \
+                    tile[rs - ti * t:re - ti * t, cs - tj * t:ce - tj * t]
+        return image, (r0 * scale, c0 * scale), scale
@@ -0,0 +1,160 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+def _in_main_bulbs(c):
+    """True where c lies in the main cardioid or the period-2 bulb"""
+    q = (c.real - 0.25)**2 + c.imag**2
+    cardioid = q * (q + (c.real - 0.25)) <= 0.25 * c.imag**2
+    bulb = (c.real + 1)**2 + c.imag**2 <= 1 / 16
+    return cardioid | bulb
+
+
+def escape_times(c, max_iter, tolerance=1e-13):
+    """Escape iteration of every point c, max_iter for points that stay bounded
+
+    Points in the main cardioid and period-2 bulb are skipped outright. The
+    rest are iterated in a compacted array that drops each point as soon as
+    it escapes or is caught in a cycle (Brent-style periodicity check against
+    a reference orbit point saved at powers of two), so the cost follows the
+    number of still-active points rather than pixels x iterations.
+    """
+    shape = np.shape(c)
+    c = np.ravel(c)
+    divtime = np.full(c.shape, max_iter, dtype=int)
+    index = np.flatnonzero(~_in_main_bulbs(c))
+    c = c[index]
+    z = c.copy()
+    reference = z.copy()
+    for i in range(max_iter):
+        if not index.size:
+            break
+        z *= z
+        z += c
+        escaped = z.real**2 + z.imag**2 > 4
+        divtime[index[escaped]] = i
+        cycling = np.abs(z - reference) < tolerance
+        done = escaped | cycling
+        if done.any():
+            keep = ~done
+            index, c, z = index[keep], c[keep], z[keep]
+            reference = reference[keep]
+        if i & (i + 1) == 0:
+            reference = z.copy()
+    return divtime.reshape(shape)
+
+
+def mandelbrot(h, w, max_iter, extent=(-2, 0.8, -1.4, 1.4), tile_rows=64,
+               workers=None):
+    """Escape-time iteration counts of the Mandelbrot set on an h x w grid
+
+    extent is (x_min, x_max, y_min, y_max). Bands of tile_rows rows are
+    computed concurrently on a thread pool (numpy releases the GIL in the
+    inner loop); workers=None uses every core.
+    """
+    x_min, x_max, y_min, y_max = extent
+    y, x = np.ogrid[y_min:y_max:h * 1j, x_min:x_max:w * 1j]
+    c = x + y * 1j
+    divtime = np.empty(c.shape, dtype=int)
+
+    def render(row):
+        divtime[row:row + tile_rows] = escape_times(c[row:row + tile_rows],
+                                                    max_iter)
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        list(pool.map(render, range(0, h, tile_rows)))
+    return divtime
+
+
+# The 20 of 27 subcubes a Menger sponge keeps (all but the face centres
+# and the body centre)
+MENGER_OFFSETS = np.array([(x, y, z) for x in range(3) for y in range(3)
+                           for z in range(3)
+                           if (x == 1) + (y == 1) + (z == 1) < 2])
+
+
+def menger_cells(order):
+    """Integer lattice positions (N, 3) of the 20^order cubes of the sponge"""
+    cells = np.zeros((1, 3), dtype=np.int64)
+    for _ in range(order):
+        cells = (3 * cells[:, None, :] + MENGER_OFFSETS).reshape(-1, 3)
+    return cells
+
+
+def menger_sponge(order, size):
+    """Exterior surface of an order-`order` Menger sponge centred at 0
+
+    Returns (vertices (V, 3), faces (F, 4)): a shared vertex buffer and the
+    quads of cube faces that are not covered by a neighbouring cube, wound
+    counter-clockwise seen from outside.
+    """
+    n = 3**order
+    cells = menger_cells(order)
+    occupied = np.zeros((n + 2,) * 3, dtype=bool)  # padded with empty cells
+    occupied[tuple((cells + 1).T)] = True
+
+    quads = []
+    for axis in range(3):
+        b, c = (axis + 1) % 3, (axis + 2) % 3
+        for side in (0, 1):
+            step = np.zeros(3, dtype=np.int64)
+            step[axis] = 1 if side else -1
+            neighbour = cells + 1 + step
+            exposed = cells[~occupied[tuple(neighbour.T)]]
+            # Corners in (b, c) order give normal +axis; reverse for -axis
+            corners = [(0, 0), (1, 0), (1, 1), (0, 1)]
+            if not side:
+                corners = corners[::-1]
+            quad = np.repeat(exposed[:, None, :], 4, axis=1)
+            quad[:, :, axis] += side
+            for k, (db, dc) in enumerate(corners):
+                quad[:, k, b] += db
+                quad[:, k, c] += dc
+            quads.append(quad)
+    quads = np.concatenate(quads)
+
+    # Share vertices: number the used lattice points in flat-index order
+    flat = np.ravel_multi_index(tuple(quads.reshape(-1, 3).T), (n + 1,) * 3)
+    used = np.zeros((n + 1)**3, dtype=bool)
+    used[flat] = True
+    lattice = np.flatnonzero(used)
+    numbering = np.empty(used.size, dtype=np.int64)
+    numbering[lattice] = np.arange(len(lattice))
+    vertices = np.column_stack(np.unravel_index(lattice, (n + 1,) * 3))
+    vertices = vertices * (size / n) - size / 2
+    return vertices, numbering[flat].reshape(-1, 4)
+
+
+def fractal_based_generation():
+    import matplotlib.pyplot as plt
+    from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+
+    # Generate Mandelbrot set
+    mandelbrot_set = mandelbrot(1000, 1500, 100)
+    plt.figure(figsize=(10, 10))
+    plt.imshow(mandelbrot_set, cmap='hot', extent=[-2, 0.8, -1.4, 1.4])
+    plt.title('Mandelbrot Set')
+    plt.savefig('mandelbrot_set.png')
+    plt.close()
+
+    # Generate Menger sponge
+    vertices, faces = menger_sponge(3, 2)
+    fig = plt.figure(figsize=(10, 10))
+    ax = fig.add_subplot(111, projection='3d')
+    collection = Poly3DCollection(
+        vertices[faces],
+        facecolors='cyan',
+        linewidths=0.1,
+        edgecolors='r',
+        alpha=0.1)
+    ax.add_collection3d(collection)
+    ax.set_xlim(-1, 1)
+    ax.set_ylim(-1, 1)
+    ax.set_zlim(-1, 1)
+    ax.set_title('Menger Sponge (Order 3)')
+    plt.savefig('menger_sponge.png')
+    plt.close()
+
+    print("Fractal-based generation completed. Images saved as 'mandelbrot_set.png' and 'menger_sponge.png'.")
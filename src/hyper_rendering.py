@@ -0,0 +1,59 @@
+from advanced_quantum_simulation import require_backend
+
+
+def hyper_realistic_rendering():
+    bpy = require_backend('bpy', 'hyper_realistic_rendering')
+
+    # Set up Blender scene
+    bpy.ops.object.select_all(action='SELECT')
+    bpy.ops.object.delete()
+
+    # Create a quantum-inspired object
+    bpy.ops.mesh.primitive_torus_add(
+        major_radius=1,
+        minor_radius=0.3,
+        location=(
+            0,
+            0,
+            0))
+    quantum_object = bpy.context.active_object
+
+    # Create a material with quantum-inspired properties
+    material = bpy.data.materials.new(name="Quantum Material")
+    material.use_nodes = True
+    quantum_object.data.materials.append(material)
+
+    # Set up nodes for the material
+    nodes = material.node_tree.nodes
+    links = material.node_tree.links
+
+    # Clear default nodes and create new ones
+    nodes.clear()
+    node_principled = nodes.new(type='ShaderNodeBsdfPrincipled')
+    node_emission = nodes.new(type='ShaderNodeEmission')
+    node_mix = nodes.new(type='ShaderNodeMixShader')
+    node_output = nodes.new(type='ShaderNodeOutputMaterial')
+
+    # Set up node properties and links
+    node_principled.inputs['Metallic'].default_value = 0.8
+    node_principled.inputs['Roughness'].default_value = 0.2
+    node_emission.inputs['Strength'].default_value = 2.0
+
+    links.new(node_principled.outputs['BSDF'], node_mix.inputs[1])
+    links.new(node_emission.outputs['Emission'], node_mix.inputs[2])
+    links.new(node_mix.outputs['Shader'], node_output.inputs['Surface'])
+
+    # Set up Eevee render settings
+    bpy.context.scene.render.engine = 'BLENDER_EEVEE'
+    bpy.context.scene.eevee.use_ssr = True
+    bpy.context.scene.eevee.use_ssr_refraction = True
+
+    # Set up camera and light
+    bpy.ops.object.camera_add(location=(3, -3, 2))
+    bpy.ops.object.light_add(type='SUN', location=(5, 5, 5))
+
+    # Render the scene
+    bpy.context.scene.render.filepath = "//quantum_hyper_realistic.png"
+    bpy.ops.render.render(write_still=True)
+
+    print("Hyper-realistic rendering completed. Image saved as 'quantum_hyper_realistic.png'.")
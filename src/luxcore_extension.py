@@ -1,10 +1,56 @@
 import logging
+import numpy as np
 import pyluxcore
 from PyQt5.QtCore import QThread, pyqtSignal
 from PyQt5.QtWidgets import QPushButton, QVBoxLayout
 
 
+# Largest LuxCore object ID; the objectidnormalized texture maps IDs to [0, 1]
+MAX_OBJECT_ID = 0xFFFFFFFF
+
+
+def instance_arrays(psi_values, X, Y, Z, threshold=1e-3, scale=None):
+    """Packed per-point instance data for the psi point cloud
+
+    Returns (transformations, object_ids): float32 (n, 16) column-major 4x4
+    matrices placing a marker of size `scale` (default half the grid
+    spacing) at every point whose |psi|^2 is at least `threshold` times the
+    peak, and uint32 IDs encoding |psi|^2 / peak for the marker colour.
+    """
+    density = np.abs(np.ravel(psi_values))**2
+    peak = density.max()
+    if peak > 0:
+        density = density / peak
+    keep = np.flatnonzero(density >= threshold)
+    if scale is None:
+        x = np.unique(np.ravel(X))
+        scale = 0.5 * (x[1] - x[0]) if len(x) > 1 else 1.0
+    transformations = np.zeros((len(keep), 16), dtype=np.float32)
+    transformations[:, [0, 5, 10]] = scale
+    transformations[:, 12] = np.ravel(X)[keep]
+    transformations[:, 13] = np.ravel(Y)[keep]
+    transformations[:, 14] = np.ravel(Z)[keep]
+    transformations[:, 15] = 1
+    object_ids = (density[keep] * (MAX_OBJECT_ID - 1)).astype(np.uint32)
+    return transformations, object_ids
+
+
+# Unit octahedron used as the per-point marker
+MARKER_POINTS = np.array([(1, 0, 0), (-1, 0, 0), (0, 1, 0), (0, -1, 0),
+                          (0, 0, 1), (0, 0, -1)], dtype=np.float32)
+MARKER_TRIANGLES = np.array([(0, 2, 4), (2, 1, 4), (1, 3, 4), (3, 0, 4),
+                             (2, 0, 5), (1, 2, 5), (3, 1, 5), (0, 3, 5)],
+                            dtype=np.uint32)
+
+
 class LuxCoreThread(QThread):
+    """Renders the psi point cloud with LuxCore
+
+    The scene holds one marker mesh that is instanced once per visible grid
+    point in a single DuplicateObject call from packed transformation and
+    object-ID arrays; the material colours each instance by its ID, so no
+    per-point scene properties are parsed.
+    """
     progress_signal = pyqtSignal(int)
     finished_signal = pyqtSignal()
 
@@ -17,6 +63,31 @@ class LuxCoreThread(QThread):
         self.samples = samples
         self.resolution = resolution
 
+    def build_scene(self):
+        scene = pyluxcore.Scene()
+        transformations, object_ids = instance_arrays(
+            self.psi_values, self.X, self.Y, self.Z)
+        scene.DefineMesh("psi_marker_mesh", MARKER_POINTS.ravel(),
+                         MARKER_TRIANGLES.ravel(), None, None, None, None)
+        # kd = (|psi|^2 / peak, 0, 0), decoded from each instance's ID
+        props = pyluxcore.Properties()
+        props.SetFromString("""
+            scene.textures.psi_density.type = objectidnormalized
+            scene.textures.psi_kd.type = scale
+            scene.textures.psi_kd.texture1 = psi_density
+            scene.textures.psi_kd.texture2 = 1 0 0
+            scene.materials.psi_material.type = matte
+            scene.materials.psi_material.kd = psi_kd
+            scene.objects.psi_marker.shape = psi_marker_mesh
+            scene.objects.psi_marker.material = psi_material
+            """)
+        scene.Parse(props)
+        scene.DuplicateObject("psi_marker", "psi_point_", len(object_ids),
+                              transformations.ravel(), object_ids)
+        scene.DeleteObject("psi_marker")
+        logging.info(f"LuxCore scene holds {len(object_ids)} instances")
+        return scene
+
     def run(self):
         logging.info("Starting LuxCore rendering process")
         try:
@@ -28,22 +99,8 @@ class LuxCoreThread(QThread):
             film.height = {self.resolution[1]}
             """)
 
-            scene = pyluxcore.Scene(config)
-
-            for i in range(len(self.X)):
-                pos = pyluxcore.Property()
-                pos.Set(pyluxcore.Property("transformation", [
-                    1, 0, 0, 0,
-                    0, 1, 0, 0,
-                    0, 0, 1, 0,
-                    self.X[i], self.Y[i], self.Z[i], 1
-                ]))
-                pos.Set(pyluxcore.Property("material.type", ["matte"]))
-                pos.Set(pyluxcore.Property("material.kd", [
-                        abs(self.psi_values[i])**2, 0, 0]))
-                scene.Parse(pos)
-
-            render_config = scene.GetRenderConfig()
+            scene = self.build_scene()
+            render_config = pyluxcore.RenderConfig(config, scene)
             session = pyluxcore.RenderSession(render_config)
             session.Start()
 
@@ -111,34 +168,11 @@ def add_luxcore_functionality(gui):
 def enhance_interactivity(gui):
     logging.info("Enhancing GUI interactivity")
     try:
-        # Add real-time parameter updates
-        for slider in [
-                gui.n_steps_slider,
-                gui.dt_slider,
-                gui.l_slider,
-                gui.m_slider,
-                gui.energy_slider,
-                gui.potential_slider,
-                gui.spin_slider,
-                gui.magnetic_field,
-                gui.electric_field,
-                gui.temperature,
-                gui.laser_intensity,
-                gui.pressure,
-                gui.perturbation_strength,
-                gui.quantum_noise,
-                gui.decoherence_rate,
-                gui.entanglement_strength]:
-            slider.valueChanged.connect(gui.on_parameter_change)
-
-        # Add method for real-time parameter updates
-        def on_parameter_change(self):
-            # Update simulation parameters in real-time
-            self.update_simulation()
-            # Trigger visualization update
-            self.update_visualization()
-
-        setattr(gui.__class__, 'on_parameter_change', on_parameter_change)
+        # Sliders already publish through the GUI's parameter bus, which
+        # debounces bursts and recomputes once per settled parameter set;
+        # wiring extra handlers here would only trigger duplicate runs.
+        gui.real_time_update.setChecked(True)
+        gui.parameter_bus.set_interval(100)
 
         logging.info("GUI interactivity enhanced successfully")
     except Exception as e:
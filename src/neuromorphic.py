@@ -0,0 +1,164 @@
+import numpy as np
+from scipy import sparse
+
+from advanced_quantum_simulation import (RHIZOME_CONNECTIONS, require_backend,
+                                         torch_device)
+
+
+def rhizome_connectivity(n_neurons, n_connections=RHIZOME_CONNECTIONS,
+                         weight=0.1, seed=None):
+    """Random directed rhizome wiring as a sparse (post x pre) weight matrix"""
+    rng = np.random.default_rng(seed)
+    pre = rng.integers(n_neurons, size=n_connections)
+    post = rng.integers(n_neurons, size=n_connections)
+    keep = pre != post
+    return sparse.csr_matrix(
+        (np.full(keep.sum(), weight), (post[keep], pre[keep])),
+        shape=(n_neurons, n_neurons))
+
+
+def graph_connectivity(graph, weight=0.1):
+    """(post x pre) weight matrix of a networkx graph; edges carry `weight`"""
+    nx = require_backend('networkx', 'graph_connectivity')
+    adjacency = nx.to_scipy_sparse_array(graph, weight=None, format='csr')
+    return sparse.csr_matrix(adjacency.T * weight)
+
+
+class SpikeEvents:
+    """Spikes as parallel (step, neuron) index arrays"""
+
+    def __init__(self, steps, neurons, n_steps, n_neurons):
+        self.steps = steps
+        self.neurons = neurons
+        self.shape = (n_steps, n_neurons)
+
+    def __len__(self):
+        return len(self.steps)
+
+    def matrix(self):
+        """Sparse (steps x neurons) 0/1 spike raster"""
+        return sparse.csr_matrix(
+            (np.ones(len(self.steps)), (self.steps, self.neurons)),
+            shape=self.shape)
+
+    def counts(self):
+        """Spike count per neuron"""
+        return np.bincount(self.neurons, minlength=self.shape[1])
+
+
+class LIFPopulation:
+    """Leaky integrate-and-fire population advanced as whole-array operations
+
+    Every step decays all membrane potentials towards `rest` by exp(-dt/tau),
+    adds the external input and the weights of last step's spikes, then fires
+    and resets every neuron at or above threshold. threshold, reset and tau
+    may be scalars or per-neuron arrays; tau=np.inf gives a perfect
+    integrator. connectivity is a sparse (post x pre) weight matrix; only the
+    outgoing rows of neurons that fired are touched, so synaptic cost scales
+    with spikes times fan-out, not with N^2.
+    """
+
+    def __init__(self, n_neurons, threshold=1.0, reset=0.0, rest=0.0,
+                 tau=20.0, dt=1.0, refractory=0, connectivity=None):
+        self.n_neurons = n_neurons
+        self.threshold = np.broadcast_to(threshold, (n_neurons,))
+        self.reset_potential = np.broadcast_to(reset, (n_neurons,))
+        self.rest = rest
+        self.decay = np.exp(-dt / np.asarray(tau, dtype=float))
+        self.refractory = refractory
+        self.outgoing = None if connectivity is None else \
+            sparse.csr_matrix(connectivity).T.tocsr()
+        self.reset()
+
+    def reset(self):
+        self.potential = np.full(self.n_neurons, float(self.rest))
+        self.refractory_left = np.zeros(self.n_neurons, dtype=np.int64)
+        self.fired = np.zeros(0, dtype=np.int64)
+
+    def step(self, current):
+        """Advance one step with the given input current; return who fired"""
+        v = self.potential
+        v -= self.rest
+        v *= self.decay
+        v += self.rest
+        v += current
+        if self.outgoing is not None and len(self.fired):
+            targets = self.outgoing[self.fired]
+            v += np.bincount(targets.indices, targets.data,
+                             minlength=self.n_neurons)
+        if self.refractory:
+            resting = self.refractory_left > 0
+            v[resting] = self.reset_potential[resting]
+            self.refractory_left[resting] -= 1
+        fired = np.flatnonzero(v >= self.threshold)
+        v[fired] = self.reset_potential[fired]
+        if self.refractory:
+            self.refractory_left[fired] = self.refractory
+        self.fired = fired
+        return fired
+
+    def run(self, inputs, n_steps=None):
+        """Run and return SpikeEvents
+
+        inputs is a (T, N) array, an (N,) array or scalar held for n_steps,
+        or a callable step -> current.
+        """
+        if callable(inputs):
+            current = inputs
+        elif np.ndim(inputs) == 2:
+            n_steps = len(inputs) if n_steps is None else n_steps
+            current = inputs.__getitem__
+        else:
+            current = (lambda step: inputs)
+        steps, neurons = [], []
+        for step in range(n_steps):
+            fired = self.step(current(step))
+            steps.append(np.full(len(fired), step))
+            neurons.append(fired)
+        return SpikeEvents(np.concatenate(steps), np.concatenate(neurons),
+                           n_steps, self.n_neurons)
+
+
+def neuromorphic_ai():
+    import matplotlib.pyplot as plt
+    torch = require_backend('torch', 'neuromorphic_ai')
+    nn = torch.nn
+    device = torch_device()
+
+    class NeuromorphicNetwork(nn.Module):
+        def __init__(self, input_size, hidden_size, output_size):
+            super(NeuromorphicNetwork, self).__init__()
+            self.fc1 = nn.Linear(input_size, hidden_size)
+            self.fc2 = nn.Linear(hidden_size, output_size)
+            self.activation = nn.ReLU()
+
+        def forward(self, x):
+            x = self.activation(self.fc1(x))
+            x = self.fc2(x)
+            return x
+
+    # Implement spiking neural network: one non-leaky integrate-and-fire
+    # neuron driven by uniform noise
+    spiking_neuron = LIFPopulation(1, tau=np.inf)
+    spikes = spiking_neuron.run(np.random.rand(100, 1))
+    spike_train = spikes.matrix().toarray()[:, 0]
+    plt.figure(figsize=(10, 5))
+    plt.plot(spike_train)
+    plt.title("Spiking Neuron Output")
+    plt.savefig("spiking_neuron_output.png")
+    print("Spiking neuron output saved as 'spiking_neuron_output.png'")
+
+    # Implement quantum-inspired neural network
+    input_size = 10
+    hidden_size = 20
+    output_size = 5
+    qnn = NeuromorphicNetwork(input_size, hidden_size, output_size).to(device)
+
+    # Generate random quantum-inspired input
+    quantum_input = torch.randn(1, input_size).to(device)
+
+    # Process input through the quantum-inspired neural network
+    output = qnn(quantum_input)
+
+    print(
+        f"Quantum-inspired neural network output: {output.detach().cpu().numpy()}")
@@ -0,0 +1,142 @@
+import itertools
+import logging
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from quantum_simulation import (ANGULAR_MOMENTA, QUANTUM_NUMBERS,
+                                SCHITZO_DECAY, SCHITZO_INTENSITY,
+                                RussellHamiltonian, aqal_quadrants,
+                                initial_wavepacket, russell_grid,
+                                schitzoanalytic_profile, spin_orbit_energy)
+from split_operator import SplitOperatorPropagator
+
+SWEEP_DEFAULTS = {'alpha': 1, 'beta': 1, 'gamma': 1, 'k': 1, 'zeta': 0.1,
+                  'dt': 0.01}
+# Rough working set per grid point of one batch member: psi, potential and
+# its phase factors, consciousness density and FFT temporaries
+BYTES_PER_POINT = 96
+
+
+def parameter_grid(**axes):
+    """Cartesian product of parameter values as a list of config dicts"""
+    names = list(axes)
+    return [dict(zip(names, values))
+            for values in itertools.product(*axes.values())]
+
+
+def _batches(configs, batch_size):
+    """Group configs by dt (shared kinetic phase) into batches of batch_size"""
+    by_dt = {}
+    for index, config in enumerate(configs):
+        by_dt.setdefault(config['dt'], []).append((index, config))
+    for members in by_dt.values():
+        for start in range(0, len(members), batch_size):
+            yield members[start:start + batch_size]
+
+
+def run_batch(batch, n_steps, x, y, z, workers=-1):
+    """Advance every config of a batch together and return tidy rows
+
+    All members share the grid, the cached grid operators and the kinetic
+    phase (one dt per batch); their states are stacked along a leading batch
+    axis so each step is one batched FFT pair.
+    """
+    indices = [index for index, _ in batch]
+    configs = [config for _, config in batch]
+    dt = configs[0]['dt']
+    hamiltonians = [RussellHamiltonian(
+        x, y, z, c['alpha'], c['beta'], c['gamma'], c['k'], c['zeta'],
+        L=ANGULAR_MOMENTA[0], S=ANGULAR_MOMENTA[1]) for c in configs]
+    X, Y, Z = hamiltonians[0].coordinates
+    consciousness = hamiltonians[0].consciousness
+    V_static = np.stack([h.V_static for h in hamiltonians])
+    gamma = np.array([c['gamma'] for c in configs],
+                     dtype=float)[:, None, None, None]
+    so_energies = [spin_orbit_energy(*QUANTUM_NUMBERS, c['zeta'])
+                   for c in configs]
+
+    psi = np.repeat(initial_wavepacket(X, Y, Z)[None], len(configs), axis=0)
+    propagator = SplitOperatorPropagator(x, y, z, V_static, dt,
+                                         workers=workers)
+    V = np.empty_like(V_static)
+    schitzo_intensity = SCHITZO_INTENSITY
+    schitzo_profile = schitzoanalytic_profile(X)
+    quadrants = aqal_quadrants()
+    dV = (x[1] - x[0]) * (y[1] - y[0]) * (z[1] - z[0])
+    axes = (1, 2, 3)
+    run_token = object()  # keys the shared consciousness cache to this batch
+
+    rows = []
+    for step in range(n_steps):
+        field = consciousness(psi, version=(run_token, step))
+        np.multiply(field, gamma, out=V)
+        V += V_static
+        propagator.update_potential(V)
+        propagator.step(psi)
+
+        probabilities = np.abs(psi)**2
+        totals = probabilities.sum(axis=axes)
+        probabilities /= totals[:, None, None, None]
+        entropies = -np.sum(probabilities * np.log(probabilities + 1e-10),
+                            axis=axes)
+
+        psi += schitzo_intensity * schitzo_profile
+        schitzo_intensity *= SCHITZO_DECAY
+        aqal_totals = np.sum(np.abs(psi)**2, axis=axes)
+
+        for member, config in enumerate(configs):
+            row = dict(config, run=indices[member], step=step,
+                       time=(step + 1) * dt,
+                       entanglement_entropy=float(entropies[member]),
+                       spin_orbit_energy=so_energies[member],
+                       norm=float(np.sqrt(totals[member] * dV)))
+            for q in quadrants:
+                row[q] = float(aqal_totals[member]) * random.random()
+            rows.append(row)
+    return rows
+
+
+def _run_batch_job(args):
+    return run_batch(*args)
+
+
+def run_parameter_sweep(configs, n_steps=100, x=None, y=None, z=None,
+                        batch_size=None, max_batch_bytes=2**30,
+                        processes=None):
+    """Run one simulation per config and return a tidy list of row dicts
+
+    Each config may set alpha, beta, gamma, k, zeta and dt (missing keys take
+    SWEEP_DEFAULTS). Configs sharing dt are stacked into batches; batches run
+    on a process pool when there is more than one and processes != 1.
+    max_batch_bytes bounds the working set of all concurrent batches
+    together: batches are sized to an equal share per worker (unless
+    batch_size is given), and the pool never runs more batches at once than
+    the budget holds. Rows hold one (run, step) each.
+    """
+    if x is None:
+        x, y, z = russell_grid()
+    configs = [dict(SWEEP_DEFAULTS, **config) for config in configs]
+    config_bytes = BYTES_PER_POINT * len(x) * len(y) * len(z)
+    workers = 1 if processes == 1 else (processes or os.cpu_count())
+    if batch_size is None:
+        batch_size = max(1, max_batch_bytes // (workers * config_bytes))
+    batches = list(_batches(configs, batch_size))
+    workers = max(1, min(workers, len(batches),
+                         max_batch_bytes // (batch_size * config_bytes)))
+    logging.info(f"Sweeping {len(configs)} configurations in "
+                 f"{len(batches)} batches of up to {batch_size} on "
+                 f"{workers} worker(s)")
+
+    if workers == 1:
+        results = [run_batch(batch, n_steps, x, y, z) for batch in batches]
+    else:
+        jobs = [(batch, n_steps, x, y, z, 1) for batch in batches]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_run_batch_job, jobs))
+
+    rows = [row for batch_rows in results for row in batch_rows]
+    rows.sort(key=lambda row: (row['run'], row['step']))
+    return rows
@@ -0,0 +1,49 @@
+import numpy as np
+
+
+def integrate_scientific_papers():
+    """Entropy and energy-shift figures of the QHR papers
+
+    The QHR model output figure needs a QHRModel, which no module in this
+    tree defines; after the two formula-based figures are saved this raises
+    a RuntimeError saying so.
+    """
+    import matplotlib.pyplot as plt
+
+    def entanglement_entropy(density_matrix):
+        eigenvalues = np.linalg.eigvalsh(density_matrix)
+        return -np.sum(eigenvalues * np.log2(eigenvalues + 1e-10))
+
+    # Visualize entanglement entropy of cos(t)|00> + sin(t)|11>, from the
+    # reduced density matrix of either qubit
+    theta = np.linspace(0, np.pi / 2, 100)
+    entropies = [entanglement_entropy(np.diag([np.cos(t)**2, np.sin(t)**2]))
+                 for t in theta]
+    plt.figure(figsize=(10, 5))
+    plt.plot(theta, entropies)
+    plt.title("Entanglement Entropy")
+    plt.xlabel("Mixing angle")
+    plt.ylabel("Entropy (bits)")
+    plt.savefig("entanglement_entropy.png")
+    plt.close()
+
+    # Implement energy level shift calculation: E(t) = E0 cos(w t) against
+    # the enhanced E(t) = E0 cos(w' t) with w' = w (1 + alpha * lambda)
+    E0, omega, alpha, coupling = 1.0, 2 * np.pi, 0.1, 0.5
+    t = np.linspace(0, 2, 500)
+    standard = E0 * np.cos(omega * t)
+    enhanced = E0 * np.cos(omega * (1 + alpha * coupling) * t)
+    plt.figure(figsize=(10, 5))
+    plt.plot(t, standard, label="Standard")
+    plt.plot(t, enhanced, label="Enhanced")
+    plt.plot(t, enhanced - standard, label="Shift")
+    plt.title("Energy Level Shifts")
+    plt.xlabel("Time")
+    plt.legend()
+    plt.savefig("energy_level_shifts.png")
+    plt.close()
+    print("Saved 'entanglement_entropy.png' and 'energy_level_shifts.png'.")
+
+    raise RuntimeError(
+        "QHR model output requires a QHRModel, which is not defined in this "
+        "tree")
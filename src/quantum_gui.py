@@ -5,13 +5,11 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from mpl_toolkits.mplot3d import Axes3D
 from PyQt5.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, QPushButton, QSlider, QLabel, QComboBox, QCheckBox, QFileDialog, QProgressBar, QDoubleSpinBox, QSpinBox, QTabWidget, QTextEdit, QGroupBox, QRadioButton, QButtonGroup
-from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QObject, QTimer, QThread, QMutex, QMutexLocker, QWaitCondition, pyqtSignal
 from PyQt5.QtGui import QVector3D
 from PyQt5.QtDataVisualization import Q3DScatter, QScatter3DSeries, QScatterDataItem
 from scipy.special import sph_harm
 from scipy.integrate import odeint
-import multiprocessing
-from functools import partial
 from scipy.interpolate import griddata
 import pyqtgraph as pg
 import pyqtgraph.opengl as gl
@@ -19,7 +17,10 @@ import logging
 import pyluxcore
 
 # Import our quantum simulation functions
-from quantum_simulation import run_russell_simulation, save_quantum_state_for_blender
+from quantum_simulation import iter_russell_simulation, russell_grid, save_quantum_state_for_blender
+
+from density_matrix import BIPARTITIONS, DensityMatrixTiles, entanglement_entropy, reduced_density_matrix
+from visualization_engine import VIEW_MODES, VisualizationEngine
 
 # Import LuxCore extension
 from luxcore_extension import LuxCoreThread, add_luxcore_functionality, enhance_interactivity
@@ -103,7 +104,9 @@ class BlenderThread(QThread):
     def run(self):
         logging.info("Starting Blender rendering process")
         # Implementation of Blender rendering process
-        save_quantum_state_for_blender(self.psi_values, self.X, self.Y, self.Z)
+        # The exporter takes the 1-D axes of the np.meshgrid(x, y, z) arrays
+        save_quantum_state_for_blender(self.psi_values, self.X[0, :, 0],
+                                       self.Y[:, 0, 0], self.Z[0, 0, :])
         for i in range(self.frames):
             # Simulate Blender rendering progress
             progress = int((i + 1) / self.frames * 100)
@@ -126,15 +129,211 @@ class BlenderThread(QThread):
         self.finished_signal.emit()
 
 
+class SimulationWorker(QThread):
+    """Long-lived thread that owns the evolving state and streams frames
+
+    Parameters are pushed with set_parameters; changing dt, the resolution or
+    the number of steps restarts the run, everything else only affects how
+    frames are post-processed. While paused, request_step after such a
+    render-only change re-renders the latest computed frame instead of
+    advancing (so does any request while a computed frame is undelivered).
+    A step that finishes after a restarting change is discarded
+    instead of being shown. Only the latest frame is delivered: a new frame
+    is emitted once the GUI has called frame_consumed.
+    """
+    frame_ready = pyqtSignal(object)
+    run_finished = pyqtSignal()
+
+    RESTART_PARAMETERS = ('n_steps', 'dt', 'resolution')
+
+    def __init__(self):
+        super().__init__()
+        self._mutex = QMutex()
+        self._wake = QWaitCondition()
+        self._params = {}
+        self._generation = 0
+        self._running = False
+        self._pending_steps = 0
+        self._restart = True
+        self._stopped = False
+        self._frame_pending = False
+        logging.debug("SimulationWorker initialized")
+
+    def set_parameters(self, params):
+        with QMutexLocker(self._mutex):
+            if any(self._params.get(name) != params.get(name)
+                   for name in self.RESTART_PARAMETERS):
+                self._restart = True
+            if params != self._params:
+                self._generation += 1
+            self._params = dict(params)
+            self._wake.wakeAll()
+
+    def set_running(self, running):
+        with QMutexLocker(self._mutex):
+            self._running = running
+            self._wake.wakeAll()
+
+    def is_running(self):
+        with QMutexLocker(self._mutex):
+            return self._running
+
+    def request_step(self):
+        """Advance (after a restart: recompute, after a render-only parameter
+        change: re-render) one frame while paused"""
+        with QMutexLocker(self._mutex):
+            self._pending_steps += 1
+            self._wake.wakeAll()
+
+    def reset(self):
+        with QMutexLocker(self._mutex):
+            self._restart = True
+            self._wake.wakeAll()
+
+    def frame_consumed(self):
+        with QMutexLocker(self._mutex):
+            self._frame_pending = False
+
+    def stop(self):
+        with QMutexLocker(self._mutex):
+            self._stopped = True
+            self._wake.wakeAll()
+        self.wait()
+
+    def _start_run(self, params):
+        x, y, z = russell_grid(params['resolution'])
+        self._coordinates = np.meshgrid(x, y, z)
+        return iter_russell_simulation(params['n_steps'], params['dt'],
+                                       x=x, y=y, z=z, verbose=False)
+
+    def _display_frame(self, snapshot, params):
+        # Experimental parameters act on a copy; the evolving state is untouched
+        X, Y, Z = self._coordinates
+        t = snapshot.time
+        psi = snapshot.psi * np.exp(-1j * params['magnetic_field'] * t)
+        psi += params['electric_field'] * Z * t
+        psi *= np.exp(-params['temperature'] * t / 100)
+        psi += params['perturbation'] * np.random.rand(*psi.shape)
+        psi += params['noise'] * \
+            (np.random.rand(*psi.shape) + 1j * np.random.rand(*psi.shape))
+        psi /= np.linalg.norm(psi)
+        psi *= np.exp(-params['decoherence'] * t)
+        return {'psi': psi, 'coordinates': self._coordinates,
+                'time': t, 'step': snapshot.step}
+
+    def run(self):
+        simulation = None
+        skipped = None  # latest snapshot dropped while the GUI was busy
+        shown, shown_generation = None, None  # last delivered snapshot
+        while True:
+            with QMutexLocker(self._mutex):
+                while not (self._stopped or self._running or
+                           self._pending_steps):
+                    self._wake.wait(self._mutex)
+                if self._stopped:
+                    return
+                params, generation = self._params, self._generation
+                restart, self._restart = self._restart, False
+                requested = self._pending_steps > 0
+                self._pending_steps = 0
+                running = self._running
+
+            if requested and not (restart or running) and \
+                    (skipped is not None or (shown is not None and
+                                             generation != shown_generation)):
+                # Snapshots share the live state buffer, so only the latest
+                # computed one still matches its psi
+                if skipped is not None:
+                    shown, skipped = skipped, None
+                with QMutexLocker(self._mutex):
+                    self._frame_pending = True
+                self.frame_ready.emit(self._display_frame(shown, params))
+                shown_generation = generation
+                continue
+            if restart or simulation is None:
+                simulation = self._start_run(params)
+                skipped = None
+                shown = None
+            try:
+                snapshot = next(simulation)
+            except StopIteration:
+                simulation = None
+                with QMutexLocker(self._mutex):
+                    self._running = False
+                if skipped is not None:
+                    self.frame_ready.emit(self._display_frame(skipped, params))
+                    shown, shown_generation = skipped, generation
+                    skipped = None
+                self.run_finished.emit()
+                continue
+
+            with QMutexLocker(self._mutex):
+                if generation != self._generation:
+                    if self._restart:
+                        continue  # stale: the run restarts with new params
+                    params = self._params  # re-render with the new settings
+                    generation = self._generation
+                deliver = requested or not self._frame_pending
+                self._frame_pending = True
+            if deliver:
+                self.frame_ready.emit(self._display_frame(snapshot, params))
+                shown, shown_generation = snapshot, generation
+                skipped = None
+            else:
+                skipped = snapshot
+
+
+class ParameterBus(QObject):
+    """Coalesces bursts of parameter changes into one settled update
+
+    Widgets call notify() on every change; the bus waits until no change has
+    arrived for `interval` ms, reads the parameters once through `read` and
+    emits `settled` only if they differ from the last settled set.
+    """
+    settled = pyqtSignal(dict)
+
+    def __init__(self, read, interval=150, parent=None):
+        super().__init__(parent)
+        self._read = read
+        self._last = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self._flush)
+
+    def set_interval(self, interval):
+        self._timer.setInterval(interval)
+
+    def notify(self, *args):
+        self._timer.start()  # restarting the timer debounces the burst
+
+    def flush(self, force=False):
+        """Publish the current parameters immediately"""
+        self._timer.stop()
+        self._flush(force)
+
+    def _flush(self, force=False):
+        params = self._read()
+        if force or params != self._last:
+            self._last = params
+            self.settled.emit(params)
+
+
 class QuantumSimulationGUI(QMainWindow):
     def __init__(self):
         super().__init__()
         logging.info("Initializing QuantumSimulationGUI")
         try:
+            self.parameter_bus = ParameterBus(self.simulation_parameters,
+                                              parent=self)
+            self.viz_engine = VisualizationEngine()
             self.initUI()
             logging.info("UI initialized successfully")
-            self.timer = QTimer(self)
-            self.timer.timeout.connect(self.update_simulation)
+            self.worker = SimulationWorker()
+            self.worker.frame_ready.connect(self.display_frame)
+            self.worker.run_finished.connect(self.simulation_finished)
+            self.parameter_bus.settled.connect(self.apply_parameters)
+            self.worker.start()
             self.current_step = 0
             self.psi_values = None
             self.X = self.Y = self.Z = None
@@ -177,14 +376,18 @@ class QuantumSimulationGUI(QMainWindow):
             'Number of Steps', 100, 10000, 1000)
         self.dt_slider = self.create_slider(
             'Time Step (dt)', 1, 100, 10)  # Values in 0.001 seconds
-        self.l_slider = self.create_slider('Angular Momentum (l)', 0, 5, 0)
+        # Sliders created with live=False do not act on the simulation yet,
+        # so moving them does not re-render
+        self.l_slider = self.create_slider(
+            'Angular Momentum (l)', 0, 5, 0, live=False)
         self.m_slider = self.create_slider(
-            'Magnetic Quantum Number (m)', -5, 5, 0)
+            'Magnetic Quantum Number (m)', -5, 5, 0, live=False)
         self.energy_slider = self.create_double_slider(
-            'Energy (eV)', 0, 100, 13.6)
+            'Energy (eV)', 0, 100, 13.6, live=False)
         self.potential_slider = self.create_double_slider(
-            'Potential (V)', -10, 10, 0)
-        self.spin_slider = self.create_double_slider('Spin', -0.5, 0.5, 0.5)
+            'Potential (V)', -10, 10, 0, live=False)
+        self.spin_slider = self.create_double_slider(
+            'Spin', -0.5, 0.5, 0.5, live=False)
 
         for slider in [
                 self.n_steps_slider,
@@ -209,8 +412,9 @@ class QuantumSimulationGUI(QMainWindow):
         self.temperature = self.create_double_slider(
             'Temperature (K)', 0, 300, 300)
         self.laser_intensity = self.create_double_slider(
-            'Laser Intensity (W/cm²)', 0, 1000, 0)
-        self.pressure = self.create_double_slider('Pressure (atm)', 0.1, 10, 1)
+            'Laser Intensity (W/cm²)', 0, 1000, 0, live=False)
+        self.pressure = self.create_double_slider(
+            'Pressure (atm)', 0.1, 10, 1, live=False)
 
         exp_layout.addWidget(self.magnetic_field)
         exp_layout.addWidget(self.electric_field)
@@ -232,7 +436,7 @@ class QuantumSimulationGUI(QMainWindow):
         self.decoherence_rate = self.create_double_slider(
             'Decoherence Rate', 0, 0.1, 0.01)
         self.entanglement_strength = self.create_double_slider(
-            'Entanglement Strength', 0, 1, 0)
+            'Entanglement Strength', 0, 1, 0, live=False)
 
         interaction_layout.addWidget(self.perturbation_strength)
         interaction_layout.addWidget(self.quantum_noise)
@@ -247,13 +451,7 @@ class QuantumSimulationGUI(QMainWindow):
         viz_layout.addWidget(QLabel('Visualization Type:'))
         self.viz_type = QComboBox()
         self.viz_type.setObjectName('viz_type')
-        self.viz_type.addItems(['Wavefunction',
-                                'Probability Density',
-                                'Phase',
-                                'Momentum Space',
-                                'Isosurface',
-                                'Streamplot',
-                                'Poincaré Section'])
+        self.viz_type.addItems(VIEW_MODES)
         self.viz_type.currentIndexChanged.connect(self.update_visualization)
         viz_layout.addWidget(self.viz_type)
 
@@ -264,6 +462,15 @@ class QuantumSimulationGUI(QMainWindow):
         viz_layout.addWidget(QLabel('Colormap:'))
         viz_layout.addWidget(self.colormap)
 
+        self.iso_level = QDoubleSpinBox()
+        self.iso_level.setDecimals(3)
+        self.iso_level.setRange(0.001, 0.999)
+        self.iso_level.setSingleStep(0.05)
+        self.iso_level.setValue(0.5)
+        self.iso_level.valueChanged.connect(self.update_visualization)
+        viz_layout.addWidget(QLabel('Iso-level (|psi|² / max):'))
+        viz_layout.addWidget(self.iso_level)
+
         layout.addLayout(viz_layout)
 
         # Add resolution control
@@ -276,6 +483,23 @@ class QuantumSimulationGUI(QMainWindow):
         # Add 3D plot using PyQtGraph
         self.gl_widget = gl.GLViewWidget()
         layout.addWidget(self.gl_widget)
+        self.scatter = None
+        self.scatter_positions = None
+        self.mesh = None
+        self.current_lines = None
+        self._color_luts = {}
+
+        # Points whose |psi|^2 (relative to the peak) falls below this
+        # threshold are not drawn
+        threshold_layout = QHBoxLayout()
+        threshold_layout.addWidget(QLabel('Point Threshold (|psi|² / max):'))
+        self.point_threshold = QDoubleSpinBox()
+        self.point_threshold.setDecimals(4)
+        self.point_threshold.setRange(0, 1)
+        self.point_threshold.setSingleStep(0.001)
+        self.point_threshold.valueChanged.connect(self.update_visualization)
+        threshold_layout.addWidget(self.point_threshold)
+        layout.addLayout(threshold_layout)
 
         # Add control buttons
         button_layout = QHBoxLayout()
@@ -308,8 +532,13 @@ class QuantumSimulationGUI(QMainWindow):
         tab = QWidget()
         layout = QVBoxLayout(tab)
 
-        # Add density matrix visualization
+        # Add density matrix visualization; the full matrix is drawn from
+        # tiles rendered on demand for the visible viewport
         self.density_matrix_plot = pg.ImageView()
+        self.density_matrix_plot.getView().sigRangeChanged.connect(
+            self.render_density_viewport)
+        self.density_tiles = None
+        self.density_size = None
         layout.addWidget(self.density_matrix_plot)
 
         # Add controls for density matrix manipulation
@@ -323,6 +552,21 @@ class QuantumSimulationGUI(QMainWindow):
         self.purify_button.clicked.connect(self.purify_density_matrix)
         controls_layout.addWidget(self.purify_button)
 
+        # Subsystem kept in the reduced density matrix and entropy
+        controls_layout.addWidget(QLabel('Bipartition:'))
+        self.bipartition = QComboBox()
+        self.bipartition.addItems(BIPARTITIONS)
+        self.bipartition.currentIndexChanged.connect(
+            self.on_density_view_change)
+        controls_layout.addWidget(self.bipartition)
+
+        controls_layout.addWidget(QLabel('View:'))
+        self.density_view = QComboBox()
+        self.density_view.addItems(['Reduced', 'Full (tiled)'])
+        self.density_view.currentIndexChanged.connect(
+            self.on_density_view_change)
+        controls_layout.addWidget(self.density_view)
+
         layout.addLayout(controls_layout)
 
         return tab
@@ -350,14 +594,16 @@ class QuantumSimulationGUI(QMainWindow):
 
         return tab
 
-    def create_slider(self, label, min_value, max_value, default_value):
+    def create_slider(self, label, min_value, max_value, default_value,
+                      live=True):
         slider = QSlider(Qt.Horizontal)
         slider.setMinimum(min_value)
         slider.setMaximum(max_value)
         slider.setValue(default_value)
         slider.setTickPosition(QSlider.TicksBelow)
         slider.setTickInterval((max_value - min_value) // 10)
-        slider.valueChanged.connect(self.on_parameter_change)
+        if live:
+            slider.valueChanged.connect(self.on_parameter_change)
 
         slider_layout = QVBoxLayout()
         slider_layout.addWidget(QLabel(label))
@@ -368,117 +614,193 @@ class QuantumSimulationGUI(QMainWindow):
 
         return slider_widget
 
-    def create_double_slider(self, label, min_value, max_value, default_value):
+    def create_double_slider(self, label, min_value, max_value, default_value,
+                             live=True):
         slider_widget = QWidget()
         layout = QHBoxLayout(slider_widget)
         layout.addWidget(QLabel(label))
         slider = QDoubleSpinBox()
         slider.setRange(min_value, max_value)
         slider.setValue(default_value)
-        slider.valueChanged.connect(self.on_parameter_change)
+        if live:
+            slider.valueChanged.connect(self.on_parameter_change)
         layout.addWidget(slider)
         return slider_widget
 
+    def parameter_value(self, widget):
+        return widget.findChild((QSlider, QDoubleSpinBox)).value()
+
+    def simulation_parameters(self):
+        return {
+            'n_steps': self.parameter_value(self.n_steps_slider),
+            'dt': self.parameter_value(self.dt_slider) * 0.001,
+            'resolution': self.parameter_value(self.resolution_slider),
+            'magnetic_field': self.parameter_value(self.magnetic_field),
+            'electric_field': self.parameter_value(self.electric_field),
+            'temperature': self.parameter_value(self.temperature),
+            'perturbation': self.parameter_value(self.perturbation_strength),
+            'noise': self.parameter_value(self.quantum_noise),
+            'decoherence': self.parameter_value(self.decoherence_rate),
+        }
+
     def toggle_simulation(self):
-        if self.timer.isActive():
-            self.timer.stop()
+        if self.worker.is_running():
+            self.worker.set_running(False)
             self.run_button.setText('Run Simulation')
         else:
-            self.timer.start(50)  # Update every 50 ms
+            self.parameter_bus.flush()
+            self.worker.set_running(True)
             self.run_button.setText('Pause Simulation')
 
     def reset_simulation(self):
-        self.timer.stop()
+        self.worker.set_running(False)
+        self.worker.reset()
         self.run_button.setText('Run Simulation')
         self.current_step = 0
         self.time = 0
         self.update_simulation()
 
     def update_simulation(self):
-        n_steps = self.n_steps_slider.children()[1].value()
-        dt = self.dt_slider.children()[1].value() * 0.001
-        l = self.l_slider.children()[1].value()
-        m = self.m_slider.children()[1].value()
-
-        resolution = self.resolution_slider.children()[1].value()
-
-        # Use multiprocessing for faster computation
-        with multiprocessing.Pool() as pool:
-            results = pool.starmap(
-                partial(
-                    run_russell_simulation, n_steps=1, dt=dt, l=l, m=m, resolution=resolution), [
-                    (i,) for i in range(n_steps)])
-
-        self.psi_values, self.X, self.Y, self.Z, _, _, _ = results[-1]
-
-        # Apply experimental parameters
-        B = self.magnetic_field.children()[1].value()
-        E = self.electric_field.children()[1].value()
-        T = self.temperature.children()[1].value()
-
-        # Modify wavefunction based on experimental parameters
-        self.psi_values *= np.exp(-1j * B * self.time)  # Magnetic field effect
-        self.psi_values += E * self.Z * self.time  # Electric field effect
-        self.psi_values *= np.exp(-T * self.time / 100)  # Temperature effect
-
-        # Apply additional interactive elements
-        perturbation = self.perturbation_strength.children()[1].value()
-        noise = self.quantum_noise.children()[1].value()
-
-        # Add perturbation and noise to the wavefunction
-        self.psi_values += perturbation * \
-            np.random.rand(*self.psi_values.shape)
-        self.psi_values += noise * \
-            (np.random.rand(*self.psi_values.shape) + 1j * np.random.rand(*self.psi_values.shape))
-
-        # Normalize the wavefunction
-        self.psi_values /= np.linalg.norm(self.psi_values)
-
-        # Add advanced quantum effects
-        self.apply_quantum_decoherence()
+        # Publish the current parameters right away and get a fresh frame
+        self.parameter_bus.flush(force=True)
+
+    def apply_parameters(self, params):
+        # Hand settled parameters to the worker; while paused, ask it for one
+        # fresh frame. Results arrive asynchronously in display_frame.
+        self.worker.set_parameters(params)
+        if not self.worker.is_running():
+            self.worker.request_step()
+
+    def display_frame(self, frame):
+        self.psi_values = frame['psi']
+        self.X, self.Y, self.Z = frame['coordinates']
+        self.time = frame['time']
+        self.current_step = frame['step'] + 1
+
+        self.viz_engine.set_state(self.psi_values, frame['coordinates'])
         entropy = self.calculate_entanglement_entropy()
         self.update_3d_plot()
         self.update_density_matrix()
         self.update_entanglement_plot(entropy)
+        self.worker.frame_consumed()
 
-        self.current_step += 1
-        self.time += dt
-        if self.current_step >= n_steps:
-            self.timer.stop()
-            self.run_button.setText('Run Simulation')
+    def simulation_finished(self):
+        self.run_button.setText('Run Simulation')
 
-    def apply_quantum_decoherence(self):
-        decoherence_rate = self.decoherence_rate.children()[1].value()
-        self.psi_values *= np.exp(-decoherence_rate * self.time)
+    def closeEvent(self, event):
+        self.worker.stop()
+        super().closeEvent(event)
 
     def calculate_entanglement_entropy(self):
-        # Calculate entanglement entropy
-        rho = np.outer(self.psi_values, np.conj(self.psi_values))
-        eigenvalues = np.linalg.eigvalsh(rho)
-        entropy = -np.sum(eigenvalues * np.log2(eigenvalues + 1e-10))
+        # Entropy of the reduced state from the Schmidt coefficients of the
+        # chosen bipartition; the full outer product is never formed
+        entropy = entanglement_entropy(
+            self.psi_values, self.bipartition.currentText())
         self.status_text.append(f"Entanglement Entropy: {entropy:.4f}")
         return entropy
 
+    def color_lookup_table(self):
+        # 256-entry RGBA float table per colormap, built once
+        name = self.colormap.currentText()
+        if name not in self._color_luts:
+            cmap = pg.colormap.get(name)
+            self._color_luts[name] = (cmap.getLookupTable(
+                0.0, 1.0, 256, alpha=True) / 255.0).astype(np.float32)
+        return self._color_luts[name]
+
     def update_3d_plot(self):
-        self.gl_widget.clear()
-
-        # Create color map
-        cmap = pg.ColorMap(
-            pos=[
-                0.0, 0.5, 1.0], color=[
-                (0, 0, 255, 255), (0, 255, 0, 255), (255, 0, 0, 255)])
-
-        # Create scatter plot item
-        scatter = gl.GLScatterPlotItem(
-            pos=np.column_stack(
-                (self.X.flatten(), self.Y.flatten(), self.Z.flatten())), size=5, color=cmap.map(
-                np.abs(
-                    self.psi_values.flatten())), pxMode=False)
-        self.gl_widget.addItem(scatter)
+        # Draw the selected view from the engine's cached per-frame data
+        mode = self.viz_type.currentText()
+        if mode == 'Isosurface':
+            self.show_isosurface()
+        elif mode == 'Streamplot':
+            self.show_probability_current()
+        else:
+            self.show_points(*self.viz_engine.points(mode))
+        for item, visible in ((self.scatter, mode not in ('Isosurface', 'Streamplot')),
+                              (self.mesh, mode == 'Isosurface'),
+                              (self.current_lines, mode == 'Streamplot')):
+            if item is not None:
+                item.setVisible(visible)
+
+    def show_points(self, positions, values, weights):
+        # Positions are uploaded only when they change; otherwise recolor
+        colors = self.color_lookup_table()[(values * 255).astype(np.intp)]
+        threshold = self.point_threshold.value()
+        if threshold > 0:
+            # Importance-based decimation: drop points below the |psi|^2 cut
+            keep = weights >= threshold
+            data = {'pos': positions[keep], 'color': colors[keep]}
+            self.scatter_positions = None
+        elif self.scatter_positions is not positions:
+            data = {'pos': positions, 'color': colors}
+            self.scatter_positions = positions
+        else:
+            data = {'color': colors}
+
+        if self.scatter is None:
+            self.scatter = gl.GLScatterPlotItem(size=5, pxMode=False, **data)
+            self.gl_widget.addItem(self.scatter)
+        else:
+            self.scatter.setData(**data)
+
+    def show_isosurface(self):
+        level = self.iso_level.value()
+        vertices, faces = self.viz_engine.isosurface(level)
+        color = self.color_lookup_table()[int(level * 255)]
+        if self.mesh is None:
+            self.mesh = gl.GLMeshItem(smooth=True, shader='shaded',
+                                      glOptions='opaque')
+            self.gl_widget.addItem(self.mesh)
+        self.mesh.setMeshData(vertexes=vertices, faces=faces)
+        self.mesh.setColor(tuple(color))
+
+    def show_probability_current(self):
+        segments, magnitude = self.viz_engine.probability_current()
+        colors = np.repeat(
+            self.color_lookup_table()[(magnitude * 255).astype(np.intp)], 2,
+            axis=0)
+        if self.current_lines is None:
+            self.current_lines = gl.GLLinePlotItem(mode='lines', width=1.5)
+            self.gl_widget.addItem(self.current_lines)
+        self.current_lines.setData(pos=segments, color=colors)
 
     def update_density_matrix(self):
-        rho = np.outer(self.psi_values, np.conj(self.psi_values))
-        self.density_matrix_plot.setImage(np.abs(rho))
+        if self.density_view.currentText() == 'Full (tiled)':
+            # |psi><psi| as a rank-1 factor; tiles are computed per viewport
+            self.density_tiles = DensityMatrixTiles.from_state(self.psi_values)
+            size = self.density_tiles.size
+            if size != self.density_size:
+                # Fit the view only for a new matrix size, so pans and zooms
+                # survive new frames; render once below, not from the signal
+                self.density_size = size
+                view = self.density_matrix_plot.getView()
+                view.blockSignals(True)
+                view.setRange(xRange=(0, size), yRange=(0, size), padding=0)
+                view.blockSignals(False)
+            self.render_density_viewport()
+        else:
+            # Show the reduced density matrix of the chosen subsystem
+            self.density_tiles = None
+            self.density_size = None
+            rho = reduced_density_matrix(
+                self.psi_values, self.bipartition.currentText())
+            self.density_matrix_plot.setImage(
+                np.abs(rho), pos=(0, 0), scale=(1, 1))
+
+    def render_density_viewport(self, *args):
+        if self.density_tiles is None:
+            return
+        view = self.density_matrix_plot.getView()
+        (x0, x1), (y0, y1) = view.viewRange()
+        image, (row0, col0), scale = self.density_tiles.render(
+            (y0, y1), (x0, x1), (int(view.height()), int(view.width())))
+        self.density_matrix_plot.setImage(
+            image.T, autoRange=False, pos=(col0, row0), scale=(scale, scale))
+
+    def on_density_view_change(self):
+        if self.psi_values is not None:
+            self.update_density_matrix()
 
     def update_entanglement_plot(self, entropy):
         self.entanglement_plot.plot(
@@ -486,10 +808,12 @@ class QuantumSimulationGUI(QMainWindow):
 
     def on_parameter_change(self):
         if self.real_time_update.isChecked():
-            self.update_simulation()
+            self.parameter_bus.notify()
 
     def update_visualization(self):
-        self.update_simulation()
+        # View changes redraw the current frame; they never re-simulate
+        if self.psi_values is not None:
+            self.update_3d_plot()
 
     def export_data(self):
         if self.psi_values is not None:
@@ -561,11 +885,10 @@ class QuantumSimulationGUI(QMainWindow):
 
     def purify_density_matrix(self):
         if self.psi_values is not None:
-            # Perform a simple purification by projecting onto the largest
-            # eigenvector
-            rho = np.outer(self.psi_values, np.conj(self.psi_values))
-            eigenvalues, eigenvectors = np.linalg.eigh(rho)
-            self.psi_values = eigenvectors[:, -1]
+            # The largest eigenvector of |psi><psi| is psi itself, so
+            # purification reduces to normalization
+            self.psi_values = self.psi_values / \
+                np.linalg.norm(self.psi_values)
             self.update_density_matrix()
 
     def create_bell_state(self):
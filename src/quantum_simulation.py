@@ -1,15 +1,18 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.special import sph_harm, genlaguerre, factorial
-from scipy.integrate import quad
-from scipy.linalg import expm
+from scipy import fft
+import functools
+import collections
 import os
 import logging
 from scientific_paper_generator import generate_scientific_paper, SimulationResult
+from split_operator import SplitOperatorPropagator, kinetic_wavenumbers
+from sparse_propagator import KrylovPropagator
+from observables import Observables, state_fingerprint
 from matplotlib.animation import FuncAnimation
 import matplotlib.cm as cm
 import random
-import json  # Add this import for Blender data export
+import json  # Blender export header
 
 # Remove VTK-related imports
 # import vtk
@@ -36,18 +39,204 @@ def C_consciousness(psi, K, x, y):
     return np.sum(np.conj(psi(x)) * psi(y) * K(x - y))
 
 
+class ConsciousnessField:
+    """Consciousness Integration component evaluated on the whole grid
+
+    Computes (|psi|^2 * K)(r) = sum_r' |psi(r')|^2 K(r - r') dV for every grid
+    point with one real FFT convolution (periodic, like the split-operator
+    propagator). The default Gaussian kernel K(r) = exp(-|r|^2 / width^2) uses
+    its analytic Fourier transform; any other callable K(dx, dy, dz) is
+    sampled once on the wrapped displacement grid. The last field is cached
+    and reused while psi is unchanged.
+    """
+
+    def __init__(self, x, y, z, kernel=None, width=1.0, workers=-1):
+        self.shape = (len(y), len(x), len(z))  # np.meshgrid(x, y, z) layout
+        self.workers = workers
+        dx, dy, dz = x[1] - x[0], y[1] - y[0], z[1] - z[0]
+        if kernel is None:
+            kx = 2 * np.pi * fft.fftfreq(len(x), d=dx)
+            ky = 2 * np.pi * fft.fftfreq(len(y), d=dy)
+            kz = 2 * np.pi * fft.rfftfreq(len(z), d=dz)
+            KX, KY, KZ = np.meshgrid(kx, ky, kz)
+            self.kernel_hat = (np.pi * width**2)**1.5 * \
+                np.exp(-(KX**2 + KY**2 + KZ**2) * width**2 / 4)
+        else:
+            offsets = [fft.fftfreq(n, d=1.0 / (n * d))
+                       for n, d in ((len(x), dx), (len(y), dy), (len(z), dz))]
+            DX, DY, DZ = np.meshgrid(*offsets)
+            self.kernel_hat = fft.rfftn(kernel(DX, DY, DZ),
+                                        workers=workers) * dx * dy * dz
+        self._key = None
+        self._field = None
+
+    def __call__(self, psi, version=None):
+        """Return the (read-only, cached) consciousness field for psi
+
+        Pass a version key that changes whenever psi is modified to skip
+        hashing psi on every call. Instances are shared between runs on the
+        same grid, so make keys unique per run, e.g. (run_token, step).
+        """
+        key = version if version is not None else state_fingerprint(psi)
+        if self._field is not None and key == self._key:
+            return self._field
+        axes = (-3, -2, -1)  # leading axes are independent batch members
+        density = np.abs(psi)**2
+        field = fft.irfftn(fft.rfftn(density, axes=axes, workers=self.workers) *
+                           self.kernel_hat, s=self.shape, axes=axes,
+                           workers=self.workers)
+        field.flags.writeable = False
+        self._key, self._field = key, field
+        return field
+
+
 def russell_hamiltonian(x, p, psi, K, alpha=1, beta=1, gamma=1):
-    """Construct the Russell-inspired Hamiltonian"""
+    """Construct the Russell-inspired Hamiltonian
+
+    K is a ConsciousnessField; the consciousness term is its field for psi.
+    """
     H_russell = (alpha *
                  V_harmony(x, p) +
                  beta *
                  T_duality()[np.newaxis, np.newaxis, :, :] +
                  gamma *
-                 quad(lambda y: C_consciousness(psi, K, x, y), -
-                      np.inf, np.inf)[0])
+                 K(_evaluate(psi, x)))
     return H_russell
 
 
+def grid_key(x, y, z):
+    """Hashable key (start, stop, num) for each axis of a uniform grid"""
+    return tuple((float(a[0]), float(a[-1]), len(a)) for a in (x, y, z))
+
+
+def _axes_from_key(grid):
+    return tuple(np.linspace(start, stop, num) for start, stop, num in grid)
+
+
+@functools.lru_cache(maxsize=8)
+def _russell_grid_parts(grid):
+    """Grid-only parts: coordinates, r^2, kinetic k^2 / 2, consciousness kernel"""
+    x, y, z = _axes_from_key(grid)
+    X, Y, Z = np.meshgrid(x, y, z)
+    r2 = X**2 + Y**2 + Z**2
+    kinetic = 0.5 * kinetic_wavenumbers(x, y, z)
+    for a in (X, Y, Z, r2, kinetic):
+        a.flags.writeable = False
+    return (X, Y, Z), r2, kinetic, ConsciousnessField(x, y, z, width=1.0)
+
+
+STATIC_POTENTIAL_CACHE_BYTES = 256 * 2**20
+_static_potentials = collections.OrderedDict()
+
+
+def _russell_static_potential(grid, alpha, k, zeta, L, S):
+    """Static real-space potential alpha * V_harmony(x) + H_SO
+
+    Kept in an LRU cache bounded by STATIC_POTENTIAL_CACHE_BYTES (the most
+    recent potential is always kept, whatever its size).
+    """
+    key = (grid, alpha, k, zeta, L, S)
+    if key in _static_potentials:
+        _static_potentials.move_to_end(key)
+        return _static_potentials[key]
+    _, r2, _, _ = _russell_grid_parts(grid)
+    V_static = alpha * 0.5 * k * r2 + \
+        spin_orbit_hamiltonian(np.array(L), np.array(S), zeta)
+    V_static.flags.writeable = False
+    _static_potentials[key] = V_static
+    while len(_static_potentials) > 1 and sum(
+            V.nbytes for V in _static_potentials.values()) > \
+            STATIC_POTENTIAL_CACHE_BYTES:
+        _static_potentials.popitem(last=False)
+    return V_static
+
+
+class RussellHamiltonian:
+    """Russell-inspired Hamiltonian with its static parts built once
+
+    H = -laplacian / 2 + alpha * V_harmony + beta * T_duality
+        + gamma * C[psi] + H_SO
+
+    The kinetic symbol, r^2 and the consciousness kernel are cached per grid
+    and the static potential per (grid, alpha, k, zeta, L, S) key, so
+    parameter sweeps on one grid reuse them. Only the consciousness field is
+    recomputed for each new psi. T_duality mixes the two components of a
+    spinor psi (trailing axis of length 2); scalar states carry no duality
+    term.
+    """
+
+    def __init__(self, x, y, z, alpha=1, beta=1, gamma=1, k=1, zeta=0.1,
+                 L=(0, 0, 1), S=(0, 0, 0.5), workers=-1):
+        self.grid = grid_key(x, y, z)
+        self.alpha, self.beta, self.gamma = alpha, beta, gamma
+        self.k, self.zeta = k, zeta
+        self.workers = workers
+        self.coordinates, self.r2, self.kinetic, self.consciousness = \
+            _russell_grid_parts(self.grid)
+        self.V_static = _russell_static_potential(
+            self.grid, alpha, k, zeta, tuple(L), tuple(S))
+        self.shape = self.V_static.shape
+        self._potential = np.empty(self.shape)
+        self._scratch = None
+
+    @staticmethod
+    def cache_info():
+        """(grid-parts lru info, (static potentials cached, their bytes))"""
+        return (_russell_grid_parts.cache_info(),
+                (len(_static_potentials),
+                 sum(V.nbytes for V in _static_potentials.values())))
+
+    def potential(self, psi, version=None, out=None):
+        """Real-space potential V_static + gamma * C[psi]"""
+        if out is None:
+            out = self._potential
+        if self.gamma:
+            density = psi if psi.ndim == 3 else \
+                np.sqrt(np.sum(np.abs(psi)**2, axis=-1))
+            np.multiply(self.consciousness(density, version), self.gamma,
+                        out=out)
+            out += self.V_static
+        else:
+            out[...] = self.V_static
+        return out
+
+    def apply(self, psi, out=None, version=None):
+        """Return H psi, written into out when given
+
+        With out (complex128, not aliasing psi) nothing is allocated: the
+        FFTs run in place on out and V psi goes through a reused scratch
+        buffer.
+        """
+        if out is None:
+            out = np.empty_like(psi, dtype=np.complex128)
+        if self._scratch is None or self._scratch.shape != psi.shape:
+            self._scratch = np.empty(psi.shape, dtype=np.complex128)
+        scratch = self._scratch
+        axes = (0, 1, 2)
+        spinor = psi.ndim != 3
+        out[...] = psi
+        psi_k = fft.fftn(out, axes=axes, overwrite_x=True,
+                         workers=self.workers)
+        psi_k *= self.kinetic[..., None] if spinor else self.kinetic
+        result = fft.ifftn(psi_k, axes=axes, overwrite_x=True,
+                           workers=self.workers)
+        if not np.may_share_memory(result, out):
+            out[...] = result
+        V = self.potential(psi, version)
+        np.multiply(V[..., None] if spinor else V, psi, out=scratch)
+        out += scratch
+        if spinor and self.beta:
+            # T_duality swaps the two spinor components
+            np.multiply(psi[..., ::-1], self.beta, out=scratch)
+            out += scratch
+        return out
+
+    def energy(self, psi, version=None):
+        """Expectation value <psi|H|psi> / <psi|psi>"""
+        H_psi = self.apply(psi, version=version)
+        return np.real(np.vdot(psi, H_psi) / np.vdot(psi, psi))
+
+
 def projection_operator(G, d_Gamma, chi_Gamma, R):
     """Projection operator for constructing cubic harmonics"""
     return (d_Gamma / len(G)) * sum(np.conj(chi_Gamma(g)) * R(g) for g in G)
@@ -63,9 +252,14 @@ def orbital_hybridization(*psi_list, coeffs):
     return sum(c * psi for c, psi in zip(coeffs, psi_list))
 
 
-def calculate_entanglement_entropy(psi, x):
+def _evaluate(psi, *coords):
+    """Materialize psi on the grid if it is given as a callable"""
+    return psi(*coords) if callable(psi) else psi
+
+
+def calculate_entanglement_entropy(psi, *coords):
     """Calculate the entanglement entropy of the wavefunction"""
-    probabilities = np.abs(psi(x))**2
+    probabilities = np.abs(_evaluate(psi, *coords))**2
     probabilities /= np.sum(probabilities)  # Normalize
     return -np.sum(probabilities * np.log(probabilities + 1e-10))
 
@@ -77,8 +271,8 @@ def spin_orbit_energy(j, l, s, zeta):
 
 # Define noncommutative geometry components
 def A(f, x): return f(x)  # Identity operator
-def H(f, x): return np.sum(np.abs(f(x))**2) * (x[1] - x[0])  # Inner product
-def D(f, x): return np.gradient(f(x), x)  # Derivative operator
+def H(f, x): return np.sum(np.abs(_evaluate(f, x))**2) * (x[1] - x[0])  # Inner product
+def D(f, x): return np.gradient(_evaluate(f, x), x)  # Derivative operator
 
 # Add new functions for AQAL integration
 
@@ -87,135 +281,201 @@ def aqal_quadrants():
     return ['Intentional', 'Behavioral', 'Cultural', 'Social']
 
 
+def schitzoanalytic_profile(x):
+    """Spatial profile of the schitzoanalytic perturbation"""
+    return np.sin(10 * x) * np.exp(-x**2 / 4)
+
+
 def schitzoanalytic_perturbation(psi, x, intensity=0.1):
     """Apply a schitzoanalytic perturbation to the wavefunction"""
-    perturbation = np.sin(10 * x) * np.exp(-x**2 / 4)
-    return psi + intensity * perturbation
+    return psi + intensity * schitzoanalytic_profile(x)
 
 
-def aqal_analysis(psi, x):
+def aqal_analysis(psi, *coords):
     """Analyze the wavefunction in AQAL quadrants"""
     quadrants = aqal_quadrants()
     analysis = {}
+    total = np.sum(np.abs(_evaluate(psi, *coords))**2)
     for q in quadrants:
-        analysis[q] = np.sum(np.abs(psi(x))**2) * random.random()
+        analysis[q] = total * random.random()
     return analysis
 
 
 def save_quantum_state_for_blender(
         psi, x, y, z, filename='quantum_state_data.json'):
-    data = {
-        'psi': psi.tolist(),
-        'x': x.tolist(),
-        'y': y.tolist(),
-        'z': z.tolist()
+    """Export psi for Blender as a raw .npy array plus a small JSON header
+
+    The header (filename) records the 1-D grid axes x, y, z and the name of
+    the .npy file next to it, which readers open with np.load(mmap_mode='r').
+    """
+    if any(np.ndim(a) != 1 for a in (x, y, z)):
+        raise ValueError("x, y and z must be 1-D grid axes, not meshgrids")
+    psi_file = os.path.splitext(filename)[0] + '.npy'
+    np.save(psi_file, np.asarray(psi), allow_pickle=False)
+    header = {
+        'format': 'npy',
+        'psi_file': os.path.basename(psi_file),
+        'shape': list(np.shape(psi)),
+        'dtype': np.asarray(psi).dtype.str,
+        'x': np.asarray(x).tolist(),
+        'y': np.asarray(y).tolist(),
+        'z': np.asarray(z).tolist()
     }
     with open(filename, 'w') as f:
-        json.dump(data, f)
+        json.dump(header, f)
 
-# Modify the run_russell_simulation function
 
+ANGULAR_MOMENTA = ((0, 0, 1), (0, 0, 0.5))  # Example L, S
+QUANTUM_NUMBERS = (1.5, 1, 0.5)  # Example j, l, s
+SCHITZO_INTENSITY, SCHITZO_DECAY = 0.1, 0.99
 
-def run_russell_simulation(n_steps=1000, dt=0.01):
-    """Run the Walter Russell-inspired quantum simulation with foundational mathematical framework"""
-    print("\nRunning advanced Walter Russell-inspired quantum simulation...")
+PROPAGATORS = {
+    'split-operator': SplitOperatorPropagator,
+    'krylov': KrylovPropagator,
+}
 
+
+SimulationStep = collections.namedtuple(
+    'SimulationStep', ['step', 'time', 'psi', 'entropy', 'so_energy', 'aqal'])
+SimulationStep.__doc__ = """Per-step snapshot yielded by iter_russell_simulation
+
+psi is the propagator's live buffer and is overwritten by the next step;
+copy it to keep it.
+"""
+
+
+def russell_grid(n_points=100, extent=5):
+    """Default uniform simulation axes x, y, z on [-extent, extent]"""
+    axis = np.linspace(-extent, extent, n_points)
+    return axis, axis.copy(), axis.copy()
+
+
+def initial_wavepacket(X, Y, Z):
+    """Initial 3D Gaussian wavepacket"""
+    return (np.exp(-(X**2 + Y**2 + Z**2) / 2) /
+            (np.pi**(3 / 4))).astype(np.complex128)
+
+
+def iter_russell_simulation(n_steps=1000, dt=0.01, method='split-operator',
+                            x=None, y=None, z=None, alpha=1, beta=1, gamma=1,
+                            k=1, zeta=0.1, verbose=True):
+    """Yield a SimulationStep for every step of the Russell-inspired simulation
+
+    method selects the time propagator: 'split-operator' (FFT, periodic) or
+    'krylov' (sparse finite differences with expm_multiply). alpha, beta and
+    gamma weight the Russell Hamiltonian terms, k is the V_harmony coupling
+    and zeta the spin-orbit coupling constant. verbose=False silences the
+    per-step progress report.
+    """
+    log = print if verbose else (lambda *args, **kwargs: None)
     # Initialize system
-    x = np.linspace(-5, 5, 100)
-    y = np.linspace(-5, 5, 100)
-    z = np.linspace(-5, 5, 100)
+    if x is None:
+        x, y, z = russell_grid()
     X, Y, Z = np.meshgrid(x, y, z)
-    def psi(x, y, z): return np.exp(-(x**2 + y**2 + z**2) / 2) / \
-        (np.pi**(3 / 4))  # Initial 3D Gaussian wavepacket
-    # 3D Gaussian kernel for consciousness effects
-    def K(x, y, z): return np.exp(-(x**2 + y**2 + z**2))
-
-    # Use noncommutative geometry components
-    nc_geometry = (A, H, D)  # Spectral triple components
-
-    psi_evolution = []
-    entropies, so_energies = [], []
-    L, S = np.array([0, 0, 1]), np.array(
-        [0, 0, 0.5])  # Example angular momenta
-    j, l, s = 1.5, 1, 0.5  # Example quantum numbers
-    zeta = 0.1  # Example spin-orbit coupling constant
-
-    # Constants for Russell-inspired Hamiltonian
-    alpha, beta, gamma = 1, 1, 1
-    k = 1  # Coupling constant for V_harmony
-
-    aqal_results = []
-    schitzo_intensity = 0.1
-
-    print("Step 1: Initializing the simulation components")
-    print(f"  - x, y, z range: [{x[0]:.2f}, {x[-1]:.2f}]")
-    print(f"  - Initial wavefunction: 3D Gaussian wavepacket")
-    print(f"  - Consciousness kernel: 3D Gaussian")
-    print(f"  - Angular momenta: L={L}, S={S}")
-    print(f"  - Quantum numbers: j={j}, l={l}, s={s}")
-    print(f"  - Spin-orbit coupling constant: zeta={zeta}")
+    psi = initial_wavepacket(X, Y, Z)
+    center = (len(y) // 2, len(x) // 2, len(z) // 2)
+
+    L, S = np.array(ANGULAR_MOMENTA[0]), np.array(ANGULAR_MOMENTA[1])
+    j, l, s = QUANTUM_NUMBERS
+
+    schitzo_intensity = SCHITZO_INTENSITY
+    schitzo_profile = schitzoanalytic_profile(X)
+    run_token = object()  # keys the shared consciousness cache to this run
+
+    log("Step 1: Initializing the simulation components")
+    log(f"  - x, y, z range: [{x[0]:.2f}, {x[-1]:.2f}]")
+    log(f"  - Initial wavefunction: 3D Gaussian wavepacket")
+    log(f"  - Consciousness kernel: 3D Gaussian")
+    log(f"  - Angular momenta: L={L}, S={S}")
+    log(f"  - Quantum numbers: j={j}, l={l}, s={s}")
+    log(f"  - Spin-orbit coupling constant: zeta={zeta}")
+
+    log("Constructing Hamiltonians")
+    # Kinetic energy -0.5 * laplacian is applied in k-space by the propagator;
+    # the harmonic part of V_harmony, the spin-orbit shift and the
+    # consciousness field (3D Gaussian kernel K(r) = exp(-r^2)) act in real space
+    hamiltonian = RussellHamiltonian(
+        x, y, z, alpha, beta, gamma, k, zeta, L=tuple(L), S=tuple(S))
+    V_static = hamiltonian.V_static
+    propagator = PROPAGATORS[method](x, y, z, V_static, dt)
+    observables = Observables(x, y, z)
+    log(f"  - Potential range: [{V_static.min():.4f}, {V_static.max():.4f}]")
+    log(
+        f"  - H_SO magnitude: {np.linalg.norm(spin_orbit_hamiltonian(L, S, zeta)):.4f}")
 
     # Time evolution
     for step in range(n_steps):
-        print(f"\nStep {step + 1}/{n_steps}")
-
-        print("  2. Applying noncommutative geometry")
-        psi_nc = nc_geometry[1](psi, X, Y, Z)
-        D_psi = nc_geometry[2](psi, X, Y, Z)
-        print(f"    - Inner product of psi: {psi_nc:.4f}")
-        print(
-            f"    - Derivative of psi at origin: {D_psi[len(x) // 2, len(y) // 2, len(z) // 2]:.4f}")
-
-        print("  3. Constructing Hamiltonians")
-        # Construct quantum mechanical Hamiltonian (simplified)
-        H_QM = -0.5 * D_psi  # Simplified kinetic energy term
-
-        # Construct Russell-inspired Hamiltonian
-        H_russell = russell_hamiltonian(X, Y, Z, psi, K, alpha, beta, gamma)
-
-        # Calculate spin-orbit coupling
-        H_so = spin_orbit_hamiltonian(L, S, zeta)
-
-        # Combine Hamiltonians: H_total = H_QM + H_Russell + H_SO
-        H_total = H_QM + H_russell + H_so
-        print(f"    - H_QM magnitude: {np.linalg.norm(H_QM):.4f}")
-        print(f"    - H_russell magnitude: {np.linalg.norm(H_russell):.4f}")
-        print(f"    - H_SO magnitude: {np.linalg.norm(H_so):.4f}")
-        print(f"    - H_total magnitude: {np.linalg.norm(H_total):.4f}")
-
-        print("  4. Time evolution")
-        # Time evolution (simplified)
-
-        def psi_evolved(x, y, z): return np.exp(-1j *
-                                                H_total * dt) * psi(x, y, z)
-        psi = psi_evolved
-        print(
-            f"    - Norm of evolved wavefunction: {np.linalg.norm(psi(X, Y, Z)):.4f}")
-
-        print("  5. Calculating observables")
+        log(f"\nStep {step + 1}/{n_steps}")
+
+        if verbose:
+            log("  2. Applying noncommutative geometry")
+            psi_nc = observables(psi, ('norm',), (run_token, step, 'in'))[
+                'norm']**2
+            D_psi = (psi[center[0], center[1] + 1, center[2]] -
+                     psi[center[0], center[1] - 1, center[2]]) / (2 * (x[1] - x[0]))
+            log(f"    - Inner product of psi: {psi_nc:.4f}")
+            log(f"    - Derivative of psi at origin: {D_psi:.4f}")
+
+        log("  3. Time evolution")
+        # Consciousness term depends on psi, so refresh the potential phase
+        V = hamiltonian.potential(psi, version=(run_token, step))
+        propagator.update_potential(V)
+        log(f"    - Potential at origin: {V[center]:.4f}")
+        propagator.step(psi)
+        # The evolved state's observables are computed once and shared by
+        # the log lines below
+        version = (run_token, step, 'evolved')
+        if verbose:
+            norm = observables(psi, ('norm',), version)['norm']
+            log(f"    - Norm of evolved wavefunction: {norm:.4f}")
+
+        log("  4. Calculating observables")
         # Calculate entanglement entropy
-        entropy = calculate_entanglement_entropy(psi, X, Y, Z)
-        entropies.append(entropy)
+        entropy = observables(psi, ('shannon_entropy',), version)[
+            'shannon_entropy']
 
         # Calculate spin-orbit coupling energy
         so_energy = spin_orbit_energy(j, l, s, zeta)
-        so_energies.append(so_energy)
 
-        print(f"    - Entanglement Entropy: {entropy:.4f}")
-        print(f"    - Spin-Orbit Coupling Energy: {so_energy:.4f}")
+        log(f"    - Entanglement Entropy: {entropy:.4f}")
+        log(f"    - Spin-Orbit Coupling Energy: {so_energy:.4f}")
 
         # Apply schitzoanalytic perturbation
-        psi = schitzoanalytic_perturbation(psi, X, Y, Z, schitzo_intensity)
-        schitzo_intensity *= 0.99  # Gradually reduce the intensity
+        psi += schitzo_intensity * schitzo_profile
+        schitzo_intensity *= SCHITZO_DECAY  # Gradually reduce the intensity
 
         # Perform AQAL analysis
-        aqal_result = aqal_analysis(psi, X, Y, Z)
-        aqal_results.append(aqal_result)
+        aqal_result = aqal_analysis(psi)
+
+        yield SimulationStep(step, (step + 1) * dt, psi, entropy, so_energy,
+                             aqal_result)
+
 
-        psi_evolution.append(psi(X, Y, Z))
+def run_russell_simulation(n_steps=1000, dt=0.01, method='split-operator',
+                           sinks=()):
+    """Run the Walter Russell-inspired quantum simulation with foundational mathematical framework
 
-    # Final wavefunction
-    psi_values = psi(X, Y, Z)
+    Each SimulationStep is handed to every sink (see simulation_sinks), so
+    wavefunction history is kept only as far as the sinks choose to keep it.
+    """
+    print("\nRunning advanced Walter Russell-inspired quantum simulation...")
+
+    x, y, z = russell_grid()
+    X, Y, Z = np.meshgrid(x, y, z)
+    entropies, so_energies, aqal_results = [], [], []
+    psi_values = None
+    try:
+        for snapshot in iter_russell_simulation(n_steps, dt, method, x, y, z):
+            entropies.append(snapshot.entropy)
+            so_energies.append(snapshot.so_energy)
+            aqal_results.append(snapshot.aqal)
+            for sink in sinks:
+                sink(snapshot)
+            psi_values = snapshot.psi
+    finally:
+        for sink in sinks:
+            if hasattr(sink, 'close'):
+                sink.close()
 
     # Save quantum state for Blender visualization
     save_quantum_state_for_blender(psi_values, x, y, z)
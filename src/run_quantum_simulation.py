@@ -6,7 +6,8 @@ import logging
 import json
 
 # Import our quantum simulation functions
-from quantum_simulation import run_russell_simulation, save_quantum_state_for_blender
+from quantum_simulation import run_russell_simulation, russell_grid, save_quantum_state_for_blender
+from trajectory_store import TrajectoryStore
 
 # Configure logging
 logging.basicConfig(
@@ -36,49 +37,39 @@ def run_simulation_and_save_results():
     quantum_noise = 0.01
     decoherence_rate = 0.001
 
-    # Run simulation
-    results = run_russell_simulation(
-        n_steps,
-        dt,
-        l,
-        m,
-        energy,
-        potential,
-        spin,
-        magnetic_field,
-        electric_field,
-        temperature,
-        perturbation_strength,
-        quantum_noise,
-        decoherence_rate)
-
-    # Save results
-    np.save('psi_values.npy', results['psi_values'])
-    np.save('entanglement_entropy.npy', results['entanglement_entropy'])
-    np.save('spin_orbit_energy.npy', results['spin_orbit_energy'])
+    # Run simulation, streaming every step into the trajectory store
+    with TrajectoryStore('simulation_trajectory.h5', mode='w',
+                         psi_every=10) as store:
+        x, y, z = russell_grid()
+        store.write_coordinates(x, y, z)
+        psi_values, X, Y, Z, entropies, so_energies, aqal_results = \
+            run_russell_simulation(n_steps, dt, sinks=[store])
+    logging.info(
+        "Saved simulation trajectory to simulation_trajectory.h5")
 
     # Generate plots
     plt.figure(figsize=(12, 8))
     plt.subplot(2, 2, 1)
-    plt.imshow(np.abs(results['psi_values'][-1])**2)
+    plt.imshow(np.abs(psi_values[:, :, psi_values.shape[2] // 2])**2)
     plt.title('Final Wavefunction Probability Density')
     plt.colorbar()
 
     plt.subplot(2, 2, 2)
-    plt.plot(results['entanglement_entropy'])
+    plt.plot(entropies)
     plt.title('Entanglement Entropy Evolution')
     plt.xlabel('Time Step')
     plt.ylabel('Entropy')
 
     plt.subplot(2, 2, 3)
-    plt.plot(results['spin_orbit_energy'])
+    plt.plot(so_energies)
     plt.title('Spin-Orbit Energy Evolution')
     plt.xlabel('Time Step')
     plt.ylabel('Energy')
 
     plt.subplot(2, 2, 4)
-    plt.imshow(results['aqal_evolution'][-1])
-    plt.title('Final AQAL Quadrant Evolution')
+    plt.imshow([[result[q] for q in result] for result in aqal_results],
+               aspect='auto')
+    plt.title('AQAL Quadrant Evolution')
     plt.colorbar()
 
     plt.tight_layout()
@@ -86,11 +77,7 @@ def run_simulation_and_save_results():
     logging.info("Saved simulation results plot to simulation_results.png")
 
     # Save quantum state for Blender
-    save_quantum_state_for_blender(
-        results['psi_values'],
-        results['X'],
-        results['Y'],
-        results['Z'])
+    save_quantum_state_for_blender(psi_values, x, y, z)
     logging.info("Saved quantum state for Blender visualization")
 
     # Save simulation parameters
@@ -1,16 +1,30 @@
 import os
+import io
+import re
+import json
+import hashlib
 import logging
+import collections
+import shutil
 import subprocess
-from reportlab.pdfgen import canvas
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from xml.sax.saxutils import escape
+from PIL import Image as PILImage
 from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.lib.utils import ImageReader
+from reportlab.platypus import Flowable, Paragraph, SimpleDocTemplate, Spacer
 import fitz  # PyMuPDF
+import numpy as np
 import matplotlib.pyplot as plt
 
 
 class SimulationResult:
-    def __init__(self):
-        self.equation = "$E = mc^2$"
+    def __init__(self, equation="$E = mc^2$", **data):
+        self.equation = equation
+        self.__dict__.update(data)
 
     def plot_data(self, path):
         plt.figure()
@@ -19,6 +33,20 @@ class SimulationResult:
         plt.close()
 
 
+# Equation rendering resolution and the number of concurrent LaTeX runs
+EQUATION_DPI = 300
+RENDER_WORKERS = 4
+# Embedded images are downsampled to IMAGE_DPI; figures fit a box of
+# FIGURE_WIDTH x FIGURE_HEIGHT points
+IMAGE_DPI = 150
+FIGURE_WIDTH, FIGURE_HEIGHT = 400, 300
+
+# On-disk artifact caches, keyed by content hash
+FIGURE_CACHE_DIR = "/home/ubuntu/images"
+# Process pool size for figure rendering (None: one per core)
+FIGURE_PROCESSES = None
+EQUATION_CACHE_DIR = "/home/ubuntu/equations"
+
 # Configure Logging
 logging.basicConfig(
     filename='scientific_paper_generation.log',
@@ -33,12 +61,13 @@ console.setFormatter(formatter)
 logging.getLogger('').addHandler(console)
 
 
-def convert_latex_to_png(latex_code, output_path):
+def convert_latex_to_png(latex_code, output_path, dpi=EQUATION_DPI):
     """
     Converts LaTeX code to a PNG image using LaTeX and dvipng.
+    Each call compiles in its own temporary directory, so calls may run
+    concurrently; the PNG is moved into place only once it is complete.
     """
     try:
-        # Create temporary LaTeX file
         tex_content = f"""
         \\documentclass{{standalone}}
         \\usepackage{{amsmath}}
@@ -46,29 +75,25 @@ def convert_latex_to_png(latex_code, output_path):
         {latex_code}
         \\end{{document}}
         """
-        tex_dir = os.path.dirname(output_path)
-        tex_file = os.path.join(tex_dir, "temp_eq.tex")
-        with open(tex_file, 'w') as f:
-            f.write(tex_content)
-        logging.debug(f"Created LaTeX file at {tex_file}")
-
-        # Compile LaTeX to DVI
-        subprocess.run(['latex', '-interaction=nonstopmode',
-                       tex_file], check=True, cwd=tex_dir)
-        logging.debug("LaTeX compilation successful.")
-
-        # Convert DVI to PNG
-        dvi_file = tex_file.replace('.tex', '.dvi')
-        subprocess.run(['dvipng', '-D', '300', '-T', 'tight',
-                       '-o', output_path, dvi_file], check=True, cwd=tex_dir)
-        logging.debug(f"Converted DVI to PNG at {output_path}")
-
-        # Clean up auxiliary files
-        for ext in ['.aux', '.log', '.dvi', '.tex']:
-            aux_file = tex_file.replace('.tex', ext)
-            if os.path.exists(aux_file):
-                os.remove(aux_file)
-                logging.debug(f"Removed auxiliary file: {aux_file}")
+        with tempfile.TemporaryDirectory(prefix="eq_") as tex_dir:
+            tex_file = os.path.join(tex_dir, "eq.tex")
+            with open(tex_file, 'w') as f:
+                f.write(tex_content)
+            logging.debug(f"Created LaTeX file at {tex_file}")
+
+            # Compile LaTeX to DVI
+            subprocess.run(['latex', '-interaction=nonstopmode', tex_file],
+                           check=True, cwd=tex_dir, capture_output=True)
+            logging.debug("LaTeX compilation successful.")
+
+            # Convert DVI to PNG
+            png_file = os.path.join(tex_dir, "eq.png")
+            subprocess.run(['dvipng', '-D', str(dpi), '-T', 'tight',
+                            '-o', png_file, "eq.dvi"], check=True,
+                           cwd=tex_dir, capture_output=True)
+            os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+            shutil.move(png_file, output_path)
+            logging.debug(f"Converted DVI to PNG at {output_path}")
 
         logging.info(f"Successfully converted LaTeX to PNG: {output_path}")
         return True
@@ -80,65 +105,159 @@ def convert_latex_to_png(latex_code, output_path):
         return False
 
 
-def embed_content(pdf_path, images, equations, citations):
+def equation_cache_path(latex_code, cache_dir, dpi=EQUATION_DPI):
+    """Cache file for an equation, keyed by a hash of its source and DPI"""
+    digest = hashlib.sha256(f"{dpi}\0{latex_code}".encode()).hexdigest()
+    return os.path.join(cache_dir, f"eq_{digest[:16]}.png")
+
+
+def render_equations(latex_codes, cache_dir, dpi=EQUATION_DPI,
+                     max_workers=RENDER_WORKERS):
+    """
+    Returns one PNG path per equation, rendering each distinct equation once.
+    Equations already in cache_dir are reused; the misses are rendered on a
+    bounded pool of workers.
+    """
+    paths = [equation_cache_path(code, cache_dir, dpi) for code in latex_codes]
+    misses = {path: code for path, code in zip(paths, latex_codes)
+              if not os.path.exists(path)}
+    logging.info(f"Equations: {len(set(paths))} distinct, "
+                 f"{len(misses)} to render")
+    if misses:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            list(pool.map(convert_latex_to_png, misses.values(), misses,
+                          [dpi] * len(misses)))
+    return paths
+
+
+class EmbeddedImage(Flowable):
+    """
+    Draws a prepared image at a fixed size. The image is written to the PDF
+    once per name as a form XObject; later uses only reference it.
+    """
+
+    def __init__(self, name, reader, width, height, digest=None):
+        super().__init__()
+        self.name = name
+        self.digest = digest
+        self.reader = reader
+        self.width = width
+        self.height = height
+
+    def wrap(self, available_width, available_height):
+        return self.width, self.height
+
+    def draw(self):
+        if not self.canv.hasForm(self.name):
+            self.canv.beginForm(self.name, 0, 0, self.width, self.height)
+            self.canv.drawImage(self.reader, 0, 0, self.width, self.height,
+                                mask='auto')
+            self.canv.endForm()
+        self.canv.doForm(self.name)
+
+
+class ImagePreparer:
+    """
+    Downsamples images to the pixels they need at the target DPI and keeps
+    one prepared image per (file content, size), so repeated images are
+    decoded once and share a single XObject in the PDF.
+    """
+
+    def __init__(self, dpi=IMAGE_DPI):
+        self.dpi = dpi
+        self._readers = {}
+
+    def __call__(self, path, max_width, max_height, natural_dpi=None):
+        """Return an EmbeddedImage fitted inside max_width x max_height points
+
+        With natural_dpi the image is never enlarged beyond its size at that
+        resolution (used for equations).
+        """
+        with open(path, 'rb') as f:
+            data = f.read()
+        image = PILImage.open(io.BytesIO(data))
+        pixel_width, pixel_height = image.size
+        scale = min(max_width / pixel_width, max_height / pixel_height)
+        if natural_dpi:
+            scale = min(scale, 72 / natural_dpi)
+        width, height = pixel_width * scale, pixel_height * scale
+        digest = hashlib.sha256(data).hexdigest()
+        name = f"img_{digest[:16]}_{round(width)}x{round(height)}"
+        if name not in self._readers:
+            target = (max(1, round(width / 72 * self.dpi)),
+                      max(1, round(height / 72 * self.dpi)))
+            if target[0] < pixel_width:
+                image = image.resize(target, PILImage.LANCZOS)
+            self._readers[name] = ImageReader(image)
+        return EmbeddedImage(name, self._readers[name], width, height, digest)
+
+
+def manifest_path(pdf_path):
+    """Sidecar file holding the build manifest of a PDF"""
+    return pdf_path + ".manifest.json"
+
+
+def embed_content(pdf_path, images, equations, citations, dpi=IMAGE_DPI,
+                  build_key=None):
     """
     Embeds images, equations, and citations into a PDF.
+    Content is laid out as a stream of flowables, so pages break wherever
+    the next item no longer fits and nothing overlaps. A manifest of every
+    placed image (role, source, content hash, XObject name) is written next
+    to the PDF, and its hash is stored in the PDF keywords. build_key is
+    recorded in the manifest for incremental rebuilds.
     """
     try:
-        c = canvas.Canvas(pdf_path, pagesize=A4)
-        width, height = A4
         logging.info(f"Creating PDF: {pdf_path}")
-        y_position = height - 50  # Starting y position
+        styles = getSampleStyleSheet()
+        prepare = ImagePreparer(dpi)
+        frame_width = A4[0] - 100
+        story = []
+        items = []
+
+        def place(flowable, role, source):
+            story.extend([flowable, Spacer(1, 20)])
+            items.append({'role': role, 'source': source,
+                          'sha256': flowable.digest, 'xobject': flowable.name})
 
         # Embed Images
         for idx, image_path in enumerate(images):
             try:
-                img = ImageReader(image_path)
-                c.drawImage(img, x=50, y=y_position, width=200, height=150)
-                logging.debug(
-                    f"Embedded image {
-                        idx +
-                        1}: {image_path} at position (50, {y_position})")
-                y_position -= 170  # Adjust y position for next image
-                if y_position < 100:
-                    c.showPage()
-                    y_position = height - 50
+                place(prepare(image_path, FIGURE_WIDTH, FIGURE_HEIGHT),
+                      'figure', image_path)
+                logging.debug(f"Embedded image {idx + 1}: {image_path}")
             except Exception as e:
                 logging.error(f"Error embedding image {image_path}: {e}")
 
         # Embed Equations
         for idx, equation_path in enumerate(equations):
             try:
-                eq_img = ImageReader(equation_path)
-                c.drawImage(eq_img, x=300, y=y_position, width=200, height=150)
+                place(prepare(equation_path, frame_width, FIGURE_HEIGHT,
+                              natural_dpi=EQUATION_DPI),
+                      'equation', equation_path)
                 logging.debug(
-                    f"Embedded equation {
-                        idx +
-                        1}: {equation_path} at position (300, {y_position})")
-                y_position -= 170
-                if y_position < 100:
-                    c.showPage()
-                    y_position = height - 50
+                    f"Embedded equation {idx + 1}: {equation_path}")
             except Exception as e:
                 logging.error(f"Error embedding equation {equation_path}: {e}")
 
         # Embed Citations as Text
-        c.setFont("Helvetica", 10)
-        y_position = 50  # Bottom of the page
+        if citations:
+            story.append(Paragraph("References", styles['Heading2']))
         for idx, citation in enumerate(citations):
-            try:
-                c.drawString(50, y_position, f"{idx + 1}. {citation}")
-                logging.debug(
-                    f"Embedded citation {
-                        idx + 1}: {citation} at position (50, {y_position})")
-                y_position += 15
-                if y_position > height - 50:
-                    c.showPage()
-                    y_position = 50
-            except Exception as e:
-                logging.error(f"Error embedding citation {citation}: {e}")
-
-        c.save()
+            story.append(Paragraph(escape(f"{idx + 1}. {citation}"),
+                                   styles['Normal']))
+            logging.debug(f"Embedded citation {idx + 1}: {citation}")
+
+        manifest = {'items': items, 'citations': len(citations),
+                    'build_key': build_key}
+        digest = hashlib.sha256(
+            json.dumps(manifest, sort_keys=True).encode()).hexdigest()
+        doc = SimpleDocTemplate(pdf_path, pagesize=A4, leftMargin=50,
+                                rightMargin=50, topMargin=50, bottomMargin=50,
+                                keywords=f"manifest-sha256:{digest}")
+        doc.build(story)
+        with open(manifest_path(pdf_path), 'w') as f:
+            json.dump(manifest, f, indent=1)
         logging.info(f"PDF generation completed: {pdf_path}")
         return True
     except Exception as e:
@@ -146,34 +265,65 @@ def embed_content(pdf_path, images, equations, citations):
         return False
 
 
+def _form_wraps_image(doc, xref):
+    """True when the form XObject at xref draws an image XObject"""
+    images = doc.xref_get_key(xref, 'Resources/XObject')[1]
+    return any(doc.xref_get_key(int(image), 'Subtype')[1] == '/Image'
+               for image in re.findall(r'(\d+) 0 R', images))
+
+
 def verify_pdf_content(pdf_path, expected_images, expected_equations):
     """
     Verifies that the PDF contains the expected number of images and equations.
+    The build manifest says what was placed; the PDF is checked against it by
+    reading only its keywords, page resources and content streams, so no
+    image data is decoded.
     """
     try:
+        with open(manifest_path(pdf_path)) as f:
+            manifest = json.load(f)
+        digest = hashlib.sha256(
+            json.dumps(manifest, sort_keys=True).encode()).hexdigest()
+
         doc = fitz.open(pdf_path)
-        actual_images = 0
-        actual_equations = 0
-        for page_num in range(len(doc)):
-            page = doc.load_page(page_num)
-            images = page.get_images(full=True)
-            actual_images += len(images)
-            for img in images:
-                xref = img[0]
-                base_image = doc.extract_image(xref)
-                image_name = base_image.get("name", "").lower()
-                # Adjust this condition based on how equations are named
-                if "equation" in image_name or "eq_" in image_name:
-                    actual_equations += 1
+        verification_passed = True
+        if doc.metadata.get('keywords') != f"manifest-sha256:{digest}":
+            logging.error("Manifest does not belong to this PDF.")
+            verification_passed = False
+
+        # Count placements (`/FormXob.<name> Do`) of image forms whose XObject
+        # is present and wraps an image
+        placed = collections.Counter()
+        wraps_image = {}
+        for page in doc:
+            resources = doc.xref_get_key(page.xref, 'Resources')[1]
+            forms = dict(re.findall(r'/FormXob\.(\w+) (\d+) 0 R', resources))
+            content = page.read_contents().decode('latin-1')
+            for name in re.findall(r'/FormXob\.(\w+) Do', content):
+                xref = int(forms.get(name, 0))
+                if xref not in wraps_image:
+                    wraps_image[xref] = bool(xref) and \
+                        _form_wraps_image(doc, xref)
+                if wraps_image[xref]:
+                    placed[name] += 1
         doc.close()
 
+        expected = collections.Counter(item['xobject']
+                                       for item in manifest['items'])
+        missing = expected - placed
+        if missing:
+            logging.error(f"Images missing from the PDF: {sorted(missing)}")
+            verification_passed = False
+        roles = collections.Counter(item['role'] for item in manifest['items']
+                                    if placed[item['xobject']] > 0)
+        actual_images, actual_equations = roles['figure'], roles['equation']
+
         logging.info(f"Verification Results:")
         logging.info(
             f"Expected Images: {expected_images}, Actual Images: {actual_images}")
         logging.info(
             f"Expected Equations: {expected_equations}, Actual Equations: {actual_equations}")
 
-        verification_passed = True
         if actual_images < expected_images:
             logging.error(
                 f"Missing images. Expected: {expected_images}, Found: {actual_images}")
@@ -194,22 +344,114 @@ def verify_pdf_content(pdf_path, expected_images, expected_equations):
         return False
 
 
+def _update_fingerprint(digest, value):
+    """Feed a result attribute (arrays, containers, scalars) into a hash"""
+    if isinstance(value, np.ndarray):
+        digest.update(f"array{value.dtype}{value.shape}".encode())
+        digest.update(np.ascontiguousarray(value).data)
+    elif isinstance(value, dict):
+        digest.update(b"dict")
+        for key in sorted(value, key=repr):
+            digest.update(repr(key).encode())
+            _update_fingerprint(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"{type(value).__name__}{len(value)}".encode())
+        for item in value:
+            _update_fingerprint(digest, item)
+    else:
+        digest.update(repr(value).encode())
+
+
+def figure_key(result):
+    """
+    Content hash of everything a result's figure depends on: its data
+    attributes and the code and constants of its plot_data method. The
+    equation is rendered separately and is left out.
+    """
+    digest = hashlib.sha256()
+    plot = type(result).plot_data
+    digest.update(f"{type(result).__qualname__}.{plot.__qualname__}".encode())
+    digest.update(plot.__code__.co_code)
+    digest.update(repr(plot.__code__.co_consts).encode())
+    _update_fingerprint(digest, {name: value
+                                 for name, value in vars(result).items()
+                                 if name != 'equation'})
+    return digest.hexdigest()
+
+
+def figure_path(result, cache_dir=FIGURE_CACHE_DIR):
+    """Cache file of a result's figure"""
+    return os.path.join(cache_dir, f"plot_{figure_key(result)[:16]}.png")
+
+
+def _init_figure_worker():
+    # Workers render off-screen; load Agg and pyplot once per process
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot
+
+
+def _plot_figure(result, path):
+    """Plot one result into path (written atomically); return seconds taken"""
+    start = time.perf_counter()
+    partial_path = f"{path[:-len('.png')]}.partial.{os.getpid()}.png"
+    result.plot_data(partial_path)
+    os.replace(partial_path, path)
+    return time.perf_counter() - start
+
+
+def render_figures(results, cache_dir=FIGURE_CACHE_DIR,
+                   processes=FIGURE_PROCESSES):
+    """
+    Returns the figure path of every result, in order, plotting only the
+    results missing from the cache. Misses are plotted on a process pool
+    whose workers use the Agg backend; processes=1 plots in this process.
+    """
+    paths = [figure_path(result, cache_dir) for result in results]
+    misses = {}
+    for result, path in zip(results, paths):
+        if not os.path.exists(path):
+            misses.setdefault(path, result)
+    logging.info(f"Figures: {len(set(paths))} distinct, "
+                 f"{len(misses)} to render")
+    if not misses:
+        return paths
+    os.makedirs(cache_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    if processes == 1 or len(misses) == 1:
+        timings = [_plot_figure(result, path)
+                   for path, result in misses.items()]
+    else:
+        with ProcessPoolExecutor(max_workers=processes,
+                                 initializer=_init_figure_worker) as pool:
+            timings = list(pool.map(_plot_figure, misses.values(), misses))
+    for path, seconds in zip(misses, timings):
+        logging.info(f"Rendered figure {path} in {seconds:.2f} s")
+    logging.info(f"Rendered {len(misses)} figures in "
+                 f"{time.perf_counter() - start:.2f} s")
+    return paths
+
+
 def generate_scientific_paper(
         simulation_results,
         output_path="final_scientific_paper.pdf"):
-    """Generates a scientific paper based on the quantum simulation results."""
+    """
+    Generates a scientific paper based on the quantum simulation results.
+    Figures and equations come from content-addressed caches, so only results
+    whose data or plotting code changed are re-plotted, and the PDF itself is
+    rebuilt only when its inputs changed.
+    """
     logging.info("Starting scientific paper generation")
+    if isinstance(simulation_results, SimulationResult):
+        simulation_results = [simulation_results]
 
-    images = []
-    equations = []
-    for idx, result in enumerate(simulation_results):
-        plot_path = f"/home/ubuntu/images/plot_{idx}.png"
-        result.plot_data(plot_path)
-        images.append(plot_path)
+    images = render_figures(simulation_results, FIGURE_CACHE_DIR)
 
-        eq_path = f"/home/ubuntu/equations/eq_{idx}.png"
-        convert_latex_to_png(result.equation, eq_path)
-        equations.append(eq_path)
+    # Identical equations share one cached render
+    equations = render_equations(
+        [result.equation for result in simulation_results],
+        EQUATION_CACHE_DIR)
 
     citations = [
         "[1] Russell, W., The Universal One, 1926.",
@@ -217,9 +459,35 @@ def generate_scientific_paper(
         "[3] Wilber, K., Integral Psychology, 2000."
     ]
 
-    embed_success = embed_content(output_path, images, equations, citations)
-    verification_passed = verify_pdf_content(
-        output_path, len(images), len(equations))
+    # The artifact paths are content hashes, so together with the layout
+    # settings they key the whole build. A build with missing artifacts is
+    # not keyed, so it is redone once they render.
+    missing = [path for path in images + equations
+               if not os.path.exists(path)]
+    build_key = None if missing else hashlib.sha256(json.dumps(
+        [images, equations, citations, IMAGE_DPI, EQUATION_DPI,
+         FIGURE_WIDTH, FIGURE_HEIGHT]).encode()).hexdigest()
+    try:
+        with open(manifest_path(output_path)) as f:
+            up_to_date = build_key is not None and \
+                json.load(f).get('build_key') == build_key and \
+                os.path.exists(output_path)
+    except (OSError, ValueError):
+        up_to_date = False
+
+    verification_passed = False
+    if up_to_date:
+        logging.info(f"Paper is up to date: {output_path}")
+        embed_success = True
+        verification_passed = verify_pdf_content(
+            output_path, len(images), len(equations))
+        if not verification_passed:
+            logging.warning("Cached paper failed verification, rebuilding")
+    if not verification_passed:
+        embed_success = embed_content(output_path, images, equations,
+                                      citations, build_key=build_key)
+        verification_passed = verify_pdf_content(
+            output_path, len(images), len(equations))
 
     if embed_success and verification_passed:
         logging.info(f"Scientific paper generated successfully: {output_path}")
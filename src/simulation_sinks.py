@@ -0,0 +1,61 @@
+import os
+import logging
+import numpy as np
+
+
+class DecimatingSink:
+    """Keep a copy of psi every `every` steps"""
+
+    def __init__(self, every=10):
+        self.every = every
+        self.steps = []
+        self.snapshots = []
+
+    def __call__(self, snapshot):
+        if snapshot.step % self.every == 0:
+            self.steps.append(snapshot.step)
+            self.snapshots.append(snapshot.psi.copy())
+
+
+class RingBufferSink:
+    """Keep the last `capacity` wavefunctions in one preallocated array"""
+
+    def __init__(self, capacity=10):
+        self.capacity = capacity
+        self.buffer = None
+        self.steps = np.full(capacity, -1)
+        self.count = 0
+
+    def __call__(self, snapshot):
+        if self.buffer is None:
+            self.buffer = np.empty((self.capacity,) + snapshot.psi.shape,
+                                   dtype=snapshot.psi.dtype)
+        slot = self.count % self.capacity
+        self.buffer[slot] = snapshot.psi
+        self.steps[slot] = snapshot.step
+        self.count += 1
+
+    def latest(self, n=None):
+        """Return (steps, wavefunctions) of the last n snapshots, oldest first"""
+        held = min(self.count, self.capacity)
+        n = held if n is None else min(n, held)
+        slots = [(self.count - n + i) % self.capacity for i in range(n)]
+        return self.steps[slots], self.buffer[slots]
+
+
+class NpyWriterSink:
+    """Write psi to directory/psi_<step>.npy every `every` steps"""
+
+    def __init__(self, directory, every=1):
+        self.directory = directory
+        self.every = every
+        self.paths = []
+        os.makedirs(directory, exist_ok=True)
+
+    def __call__(self, snapshot):
+        if snapshot.step % self.every == 0:
+            path = os.path.join(self.directory,
+                                f"psi_{snapshot.step:06d}.npy")
+            np.save(path, snapshot.psi)
+            self.paths.append(path)
+            logging.debug(f"Wrote step {snapshot.step} to {path}")
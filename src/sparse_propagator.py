@@ -0,0 +1,76 @@
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import expm_multiply
+
+
+def laplacian_1d(n, d, boundary='dirichlet'):
+    """Second-order finite-difference Laplacian on n points with spacing d"""
+    main = -2.0 * np.ones(n)
+    off = np.ones(n - 1)
+    lap = sp.diags([off, main, off], [-1, 0, 1], format='lil')
+    if boundary == 'periodic':
+        lap[0, n - 1] = lap[n - 1, 0] = 1.0
+    elif boundary != 'dirichlet':
+        raise ValueError(f"Unknown boundary condition: {boundary}")
+    return lap.tocsr() / d**2
+
+
+def laplacian_3d(x, y, z, boundary='dirichlet'):
+    """Kronecker sum of 1D Laplacians in the np.meshgrid(x, y, z) layout
+
+    Arrays from np.meshgrid(x, y, z) are indexed (y, x, z), so the C-order
+    flattened state uses y as the slowest and z as the fastest axis.
+    """
+    lap_x = laplacian_1d(len(x), x[1] - x[0], boundary)
+    lap_y = laplacian_1d(len(y), y[1] - y[0], boundary)
+    lap_z = laplacian_1d(len(z), z[1] - z[0], boundary)
+    return sp.kronsum(sp.kronsum(lap_z, lap_x, format='csr'), lap_y,
+                      format='csr')
+
+
+def sparse_hamiltonian(x, y, z, V, mass=1.0, boundary='dirichlet'):
+    """CSR matrix of -laplacian / (2 mass) + V with seven entries per row"""
+    H = -laplacian_3d(x, y, z, boundary) / (2 * mass)
+    H = (H + sp.diags(np.ravel(V))).tocsr()
+    H.sort_indices()
+    return H
+
+
+class KrylovPropagator:
+    """Propagate psi with exp(-iH dt) applied by scipy's expm_multiply
+
+    H is assembled once as a sparse finite-difference matrix, so memory is
+    linear in the number of grid points and no dense exponential is ever
+    formed. update_potential rewrites only the stored diagonal, and step
+    mirrors SplitOperatorPropagator.step so the two are interchangeable.
+    """
+
+    def __init__(self, x, y, z, V, dt, mass=1.0, boundary='dirichlet'):
+        self.dt = dt
+        self.shape = np.shape(V)
+        H = sparse_hamiltonian(x, y, z, np.zeros(self.shape), mass, boundary)
+        self.generator = (-1j * dt * H).tocsr()
+        self._diagonal = self._diagonal_positions(self.generator)
+        self._kinetic_diagonal = self.generator.data[self._diagonal].copy()
+        self.update_potential(V)
+
+    @staticmethod
+    def _diagonal_positions(A):
+        rows = np.repeat(np.arange(A.shape[0]), np.diff(A.indptr))
+        return np.flatnonzero(A.indices == rows)
+
+    def update_potential(self, V):
+        """Replace the potential on the diagonal of -i H dt in place"""
+        self.generator.data[self._diagonal] = self._kinetic_diagonal - \
+            1j * self.dt * np.ravel(V)
+        self._trace = self.generator.data[self._diagonal].sum()
+
+    def step(self, psi, n_steps=1):
+        """Advance psi (complex128, modified in place) by n_steps time steps"""
+        if psi.dtype != np.complex128:
+            raise TypeError("psi must be a complex128 array")
+        evolved = expm_multiply(self.generator, psi.ravel(), start=0,
+                                stop=n_steps, num=2, endpoint=True,
+                                traceA=self._trace)[-1]
+        psi[...] = evolved.reshape(self.shape)
+        return psi
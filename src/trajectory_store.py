@@ -0,0 +1,92 @@
+import logging
+import h5py
+import numpy as np
+
+
+class TrajectoryStore:
+    """Chunked, compressed HDF5 store for a simulation trajectory
+
+    Time is the leading axis of every dataset. Use the store as a sink for
+    run_russell_simulation: each step is appended and flushed as it arrives,
+    so a crash loses at most the step in flight. psi is kept every
+    `psi_every` steps and chunked per step and z-slab, so reading one step or
+    one z-plane touches only the chunks it needs.
+    """
+
+    def __init__(self, path, mode='r', psi_every=1, compression='gzip',
+                 compression_opts=4, z_chunk=8):
+        self.path = path
+        self.psi_every = psi_every
+        self.compression = compression
+        self.compression_opts = compression_opts
+        self.z_chunk = z_chunk
+        self.file = h5py.File(path, mode)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self.file.id.valid:
+            self.file.close()
+
+    def _series(self, name, shape=(), dtype=np.float64):
+        if name not in self.file:
+            self.file.create_dataset(name, shape=(0,) + shape,
+                                     maxshape=(None,) + shape, dtype=dtype,
+                                     chunks=(1024,) + shape)
+        return self.file[name]
+
+    def _psi_dataset(self, psi):
+        if 'psi' not in self.file:
+            chunks = (1,) + psi.shape[:-1] + (min(self.z_chunk, psi.shape[-1]),)
+            self.file.create_dataset(
+                'psi', shape=(0,) + psi.shape, maxshape=(None,) + psi.shape,
+                dtype=psi.dtype, chunks=chunks, shuffle=True,
+                compression=self.compression,
+                compression_opts=self.compression_opts)
+        return self.file['psi']
+
+    @staticmethod
+    def _append(dataset, value):
+        dataset.resize(dataset.shape[0] + 1, axis=0)
+        dataset[-1] = value
+
+    def write_coordinates(self, x, y, z):
+        for name, axis in zip('xyz', (x, y, z)):
+            if name in self.file:
+                del self.file[name]
+            self.file.create_dataset(name, data=axis)
+
+    def __call__(self, snapshot):
+        self.append(snapshot)
+
+    def append(self, snapshot):
+        """Append one SimulationStep and flush it to disk"""
+        self._append(self._series('step', dtype=np.int64), snapshot.step)
+        self._append(self._series('time'), snapshot.time)
+        self._append(self._series('entanglement_entropy'), snapshot.entropy)
+        self._append(self._series('spin_orbit_energy'), snapshot.so_energy)
+        quadrants = list(snapshot.aqal)
+        aqal = self._series('aqal', shape=(len(quadrants),))
+        aqal.attrs['quadrants'] = quadrants
+        self._append(aqal, [snapshot.aqal[q] for q in quadrants])
+        if snapshot.step % self.psi_every == 0:
+            self._append(self._psi_dataset(snapshot.psi), snapshot.psi)
+            self._append(self._series('psi_step', dtype=np.int64),
+                         snapshot.step)
+        self.file.flush()
+        logging.debug(f"Stored step {snapshot.step} in {self.path}")
+
+    def psi_at(self, index):
+        """Return the index-th stored wavefunction"""
+        return self.file['psi'][index]
+
+    def z_plane(self, z_index, steps=slice(None)):
+        """Return psi[steps, :, :, z_index] without loading whole states"""
+        return self.file['psi'][steps, :, :, z_index]
+
+    def series(self, name):
+        return self.file[name][()]
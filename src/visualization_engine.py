@@ -0,0 +1,156 @@
+import functools
+import numpy as np
+import pyqtgraph as pg
+from scipy import fft
+
+from quantum_simulation import _axes_from_key, grid_key
+
+VIEW_MODES = ['Wavefunction',
+              'Probability Density',
+              'Phase',
+              'Momentum Space',
+              'Isosurface',
+              'Streamplot',
+              'Poincaré Section']
+
+
+@functools.lru_cache(maxsize=8)
+def _grid_points(grid):
+    """Real-space point positions (N, 3) in the np.meshgrid(x, y, z) order"""
+    X, Y, Z = np.meshgrid(*_axes_from_key(grid))
+    points = np.column_stack((X.ravel(), Y.ravel(), Z.ravel()))
+    return points.astype(np.float32)
+
+
+@functools.lru_cache(maxsize=8)
+def _momentum_points(grid):
+    """Centred (fftshift-ed) k-space point positions (N, 3)"""
+    kx, ky, kz = (fft.fftshift(2 * np.pi * fft.fftfreq(len(a), d=a[1] - a[0]))
+                  for a in _axes_from_key(grid))
+    KX, KY, KZ = np.meshgrid(kx, ky, kz)
+    points = np.column_stack((KX.ravel(), KY.ravel(), KZ.ravel()))
+    return points.astype(np.float32)
+
+
+def _normalized(values):
+    peak = values.max()
+    return values / peak if peak > 0 else values
+
+
+class VisualizationEngine:
+    """View data for the wavefunction tab, derived lazily from one state
+
+    set_state() is called once per simulation frame. Each view (densities,
+    phase, the momentum-space FFT, isosurface meshes, the probability current)
+    is computed on first use and cached until the next state, so switching
+    views or redrawing only costs the work that was not done yet, and never
+    a re-simulation. Grid-only data is cached per grid.
+    """
+
+    def __init__(self, workers=-1):
+        self.workers = workers
+        self.psi = None
+        self.grid = None
+        self.version = 0
+        self._cache = {}
+
+    def set_state(self, psi, coordinates):
+        X, Y, Z = coordinates
+        self.psi = psi
+        self.grid = grid_key(X[0, :, 0], Y[:, 0, 0], Z[0, 0, :])
+        self.axes = _axes_from_key(self.grid)
+        self.version += 1
+        self._cache.clear()
+
+    def _cached(self, key, compute):
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def density(self):
+        """|psi|^2 relative to its peak"""
+        return self._cached('density',
+                            lambda: _normalized(np.abs(self.psi)**2))
+
+    def momentum_density(self):
+        """Centred |psi(k)|^2 relative to its peak, from one FFT per state"""
+        def compute():
+            psi_k = fft.fftn(self.psi, axes=(-3, -2, -1),
+                             workers=self.workers)
+            return _normalized(fft.fftshift(np.abs(psi_k)**2))
+        return self._cached('momentum', compute)
+
+    def points(self, mode):
+        """Return (positions, values, weights) for a point-cloud view
+
+        values in [0, 1] select the colour, weights (|psi|^2 relative to the
+        peak, in the space being shown) are what the point threshold cuts on.
+        """
+        def compute():
+            positions = _grid_points(self.grid)
+            density = self.density().ravel()
+            if mode == 'Phase':
+                phase = np.angle(self.psi).ravel()
+                return positions, (phase + np.pi) / (2 * np.pi), density
+            if mode == 'Momentum Space':
+                momentum = self.momentum_density().ravel()
+                return _momentum_points(self.grid), np.sqrt(momentum), momentum
+            if mode == 'Probability Density':
+                return positions, density, density
+            if mode == 'Poincaré Section':
+                # The z = 0 plane (middle z index) of the density
+                nz = len(self.axes[2])
+                section = np.zeros(self.psi.shape, dtype=bool)
+                section[:, :, nz // 2] = True
+                section = section.ravel()
+                plane = _normalized(density[section])
+                return positions[section], plane, plane
+            return positions, np.sqrt(density), density
+        return self._cached(('points', mode), compute)
+
+    def isosurface(self, level):
+        """Marching-cubes mesh (vertices, faces) of |psi|^2 / max = level
+
+        Vertices are in grid coordinates (x, y, z). The mesh is reused until
+        the state or the level changes.
+        """
+        def compute():
+            vertices, faces = pg.isosurface(
+                np.ascontiguousarray(self.density()), level)
+            if len(vertices) == 0:
+                return np.zeros((0, 3), np.float32), np.zeros((0, 3), np.int32)
+            # Array axes are (y, x, z); map fractional indices onto the axes
+            x, y, z = self.axes
+            vertices = np.column_stack((
+                x[0] + vertices[:, 1] * (x[1] - x[0]),
+                y[0] + vertices[:, 0] * (y[1] - y[0]),
+                z[0] + vertices[:, 2] * (z[1] - z[0])))
+            return vertices.astype(np.float32), faces.astype(np.int32)
+        return self._cached(('isosurface', float(level)), compute)
+
+    def probability_current(self, stride=4, length=None):
+        """Line segments (2M, 3) along j = Im(psi* grad psi) on a coarse grid
+
+        Arrows are scaled so the strongest spans `length` (default: one
+        coarse cell); the second return value holds |j| relative to the peak
+        for each segment.
+        """
+        def compute():
+            x, y, z = self.axes
+            psi = self.psi[::stride, ::stride, ::stride]
+            spacing = (y[stride] - y[0], x[stride] - x[0], z[stride] - z[0])
+            gradients = np.gradient(psi, *spacing)
+            # Gradients come in array-axis order (y, x, z)
+            j = np.stack([np.imag(np.conj(psi) * gradients[i])
+                          for i in (1, 0, 2)], axis=-1).reshape(-1, 3)
+            magnitude = np.linalg.norm(j, axis=1)
+            peak = magnitude.max()
+            scale = (length or spacing[1]) / peak if peak > 0 else 0
+            start = _grid_points(self.grid).reshape(
+                self.psi.shape + (3,))[::stride, ::stride, ::stride]
+            start = start.reshape(-1, 3)
+            segments = np.empty((2 * len(start), 3), dtype=np.float32)
+            segments[0::2] = start
+            segments[1::2] = start + scale * j
+            return segments, _normalized(magnitude)
+        return self._cached(('current', stride, length), compute)
@@ -0,0 +1,27 @@
+import json
+
+import numpy as np
+import pytest
+
+from quantum_simulation import save_quantum_state_for_blender
+
+
+def test_header_holds_axes_and_psi_round_trips(tmp_path):
+    x, y, z = np.linspace(-1, 1, 6), np.linspace(-2, 2, 5), np.linspace(0, 1, 4)
+    X, Y, Z = np.meshgrid(x, y, z)
+    psi = np.exp(1j * X) * Y + Z
+    header_file = tmp_path / 'state.json'
+    save_quantum_state_for_blender(psi, x, y, z, str(header_file))
+
+    header = json.loads(header_file.read_text())
+    np.testing.assert_array_equal(header['x'], x)
+    np.testing.assert_array_equal(header['z'], z)
+    stored = np.load(tmp_path / header['psi_file'], mmap_mode='r')
+    np.testing.assert_array_equal(stored, psi)
+
+
+def test_meshgrids_are_rejected(tmp_path):
+    x = np.linspace(-1, 1, 4)
+    X, Y, Z = np.meshgrid(x, x, x)
+    with pytest.raises(ValueError):
+        save_quantum_state_for_blender(X, X, Y, Z, str(tmp_path / 'state.json'))
@@ -0,0 +1,46 @@
+import numpy as np
+
+from quantum_simulation import ConsciousnessField
+
+
+def direct_field(density, kernel, x, y, z):
+    """sum_r' density(r') K(r - r') dV with periodically wrapped r - r'"""
+    dx, dy, dz = x[1] - x[0], y[1] - y[0], z[1] - z[0]
+    ny, nx, nz = density.shape
+    iy, ix, iz = np.meshgrid(np.arange(ny), np.arange(nx), np.arange(nz),
+                             indexing='ij')
+
+    def wrapped(i, n, d):
+        i = i % n
+        return np.where(i >= (n + 1) // 2, i - n, i) * d  # fftfreq order
+
+    field = np.empty(density.shape)
+    for r in np.ndindex(density.shape):
+        K = kernel(wrapped(r[1] - ix, nx, dx), wrapped(r[0] - iy, ny, dy),
+                   wrapped(r[2] - iz, nz, dz))
+        field[r] = np.sum(density * K)
+    return field * dx * dy * dz
+
+
+def test_fft_convolution_matches_direct_sum():
+    x = np.linspace(-3, 3, 8)
+    y = np.linspace(-2, 2, 6)
+    z = np.linspace(-3, 3, 7)
+    rng = np.random.default_rng(0)
+    psi = rng.normal(size=(6, 8, 7)) + 1j * rng.normal(size=(6, 8, 7))
+
+    def kernel(dx, dy, dz):
+        return np.exp(-(dx**2 + 2 * dy**2 + dz**2)) * (1 + 0.3 * dx)
+
+    field = ConsciousnessField(x, y, z, kernel=kernel)(psi)
+    expected = direct_field(np.abs(psi)**2, kernel, x, y, z)
+    np.testing.assert_allclose(field, expected, rtol=1e-10, atol=1e-12)
+
+
+def test_field_is_cached_per_version():
+    x = y = z = np.linspace(-3, 3, 8)
+    field = ConsciousnessField(x, y, z)
+    psi = np.ones((8, 8, 8), dtype=complex)
+    first = field(psi, version=1)
+    assert field(psi * 2, version=1) is first
+    assert field(psi * 2, version=2) is not first
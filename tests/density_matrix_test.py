@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from density_matrix import (DensityMatrixTiles, entanglement_entropy,
+                            reduced_density_matrix, schmidt_coefficients)
+
+
+def random_state(shape, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=shape) + 1j * rng.normal(size=shape)
+
+
+@pytest.mark.parametrize('bipartition', ['x|yz', 'y|xz', 'z|xy'])
+def test_entropy_matches_reduced_density_matrix(bipartition):
+    psi = random_state((5, 6, 4))
+    rho = reduced_density_matrix(psi, bipartition)
+    assert np.trace(rho).real == pytest.approx(1)
+    np.testing.assert_allclose(rho, rho.conj().T, atol=1e-12)
+    p = np.linalg.eigvalsh(rho)
+    p = p[p > 1e-15]
+    assert entanglement_entropy(psi, bipartition) == \
+        pytest.approx(-np.sum(p * np.log2(p)))
+
+
+def test_schmidt_coefficients_are_normalized_singular_values():
+    psi = random_state((3, 4, 5), seed=1)
+    s = schmidt_coefficients(psi)
+    assert np.sum(s**2) == pytest.approx(1)
+    assert np.all(np.diff(s) <= 0)
+
+
+def test_bell_state_has_one_bit():
+    bell = np.array([1, 0, 0, 1]) / np.sqrt(2)
+    assert entanglement_entropy(bell) == pytest.approx(1)
+
+
+def test_product_state_has_no_entropy():
+    x, y, z = np.exp(-np.linspace(-2, 2, 6)**2), np.arange(1, 5), np.ones(3)
+    psi = np.einsum('j,i,k->ijk', x, y, z)  # (y, x, z) layout
+    for bipartition in ('x|yz', 'y|xz', 'z|xy'):
+        assert entanglement_entropy(psi, bipartition) == \
+            pytest.approx(0, abs=1e-9)
+
+
+def block_means(matrix, block):
+    n = len(matrix)
+    starts = np.arange(0, n, block)
+    counts = np.minimum(block, n - starts)
+    sums = np.add.reduceat(np.add.reduceat(matrix, starts, axis=0),
+                           starts, axis=1)
+    return sums / np.outer(counts, counts)
+
+
+def test_full_resolution_render_is_abs_rho():
+    psi = np.ravel(random_state((5, 5, 4), seed=2))
+    psi /= np.linalg.norm(psi)
+    tiles = DensityMatrixTiles.from_state(psi, tile_size=16)
+    image, origin, scale = tiles.render((10, 70), (30, 100), (100, 100))
+    assert (origin, scale) == ((10, 30), 1)
+    rho = np.abs(np.outer(psi, psi.conj()))
+    np.testing.assert_allclose(image, rho[10:70, 30:100], rtol=1e-6)
+
+
+@pytest.mark.parametrize('shape', [(25, 25), (12, 40)])
+def test_zoomed_out_render_is_block_mean_of_abs_rho(shape):
+    psi = np.ravel(random_state((5, 5, 4), seed=3))
+    psi /= np.linalg.norm(psi)
+    tiles = DensityMatrixTiles.from_state(psi, tile_size=8)
+    image, origin, scale = tiles.render((0, 100), (0, 100), shape)
+    assert scale > 1 and origin == (0, 0)
+    expected = block_means(np.abs(np.outer(psi, psi.conj())), scale)
+    np.testing.assert_allclose(image, expected, rtol=1e-5, atol=1e-9)
+
+
+def test_zoomed_out_mixture_bounds_abs_rho():
+    states = [random_state(60, seed=s) for s in (4, 5)]
+    tiles = DensityMatrixTiles.from_mixture(states, [0.3, 0.7], tile_size=16)
+    rho = sum(w * np.outer(v, v.conj()) / np.vdot(v, v).real
+              for w, v in zip((0.3, 0.7), states))
+    image, _, _ = tiles.render((0, 60), (0, 60), (60, 60))
+    np.testing.assert_allclose(image, np.abs(rho), rtol=1e-5, atol=1e-9)
+    image, _, scale = tiles.render((0, 60), (0, 60), (15, 15))
+    assert scale == 4
+    assert np.all(image >= block_means(np.abs(rho), scale) - 1e-7)
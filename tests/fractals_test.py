@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from fractals import mandelbrot, menger_cells, menger_sponge
+
+
+def mandelbrot_reference(h, w, max_iter):
+    """The original full-grid escape-time iteration"""
+    y, x = np.ogrid[-1.4:1.4:h * 1j, -2:0.8:w * 1j]
+    c = x + y * 1j
+    z = c
+    divtime = max_iter + np.zeros(z.shape, dtype=int)
+    with np.errstate(over='ignore', invalid='ignore'):
+        for i in range(max_iter):
+            z = z**2 + c
+            diverge = z * np.conj(z) > 2**2
+            div_now = diverge & (divtime == max_iter)
+            divtime[div_now] = i
+            z[diverge] = 2
+    return divtime
+
+
+@pytest.mark.parametrize('h, w, max_iter', [(120, 160, 50), (97, 131, 200)])
+def test_mandelbrot_matches_reference(h, w, max_iter):
+    np.testing.assert_array_equal(
+        mandelbrot(h, w, max_iter, tile_rows=17),
+        mandelbrot_reference(h, w, max_iter))
+
+
+@pytest.mark.parametrize('order', range(4))
+def test_menger_sponge_volume(order):
+    vertices, faces = menger_sponge(order, 2.0)
+    # Divergence theorem over the outward-wound quads, split into triangles
+    quads = vertices[faces]
+    volume = sum(
+        np.einsum('ij,ij->i', quads[:, 0],
+                  np.cross(quads[:, a], quads[:, b])).sum()
+        for a, b in ((1, 2), (2, 3))) / 6
+    assert volume == pytest.approx(8 * (20 / 27)**order)
+    assert len(menger_cells(order)) == 20**order
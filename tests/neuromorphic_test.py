@@ -0,0 +1,42 @@
+import numpy as np
+
+from neuromorphic import LIFPopulation, rhizome_connectivity
+
+
+def scalar_neuron_spikes(inputs, threshold=1.0, reset=0.0):
+    """The original one-neuron integrate-and-fire loop"""
+    potential, spikes = 0.0, []
+    for x in inputs:
+        potential += x
+        if potential >= threshold:
+            potential = reset
+            spikes.append(1.0)
+        else:
+            spikes.append(0.0)
+    return np.array(spikes)
+
+
+def test_lif_reproduces_scalar_neuron():
+    inputs = np.random.default_rng(1).random((100, 1))
+    spikes = LIFPopulation(1, tau=np.inf).run(inputs)
+    np.testing.assert_array_equal(spikes.matrix().toarray()[:, 0],
+                                  scalar_neuron_spikes(inputs[:, 0]))
+
+
+def test_unconnected_population_is_independent_neurons():
+    inputs = np.random.default_rng(2).random((80, 5))
+    spikes = LIFPopulation(5, tau=np.inf).run(inputs).matrix().toarray()
+    for n in range(5):
+        np.testing.assert_array_equal(spikes[:, n],
+                                      scalar_neuron_spikes(inputs[:, n]))
+
+
+def test_spikes_propagate_along_connectivity():
+    weights = rhizome_connectivity(50, n_connections=400, weight=0.5, seed=3)
+    # A high threshold keeps the targets below firing, whatever their fan-in
+    population = LIFPopulation(50, threshold=10.0, tau=np.inf,
+                               connectivity=weights)
+    population.step(np.where(np.arange(50) == 0, 10.0, 0.0))
+    population.step(0.0)
+    targets = weights[:, 0].toarray().ravel()
+    np.testing.assert_allclose(population.potential, targets)
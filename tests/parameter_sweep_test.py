@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from parameter_sweep import run_parameter_sweep
+from quantum_simulation import (SCHITZO_DECAY, SCHITZO_INTENSITY,
+                                iter_russell_simulation, russell_grid,
+                                schitzoanalytic_profile)
+
+CONFIGS = [{'gamma': 0.5}, {'alpha': 2, 'zeta': 0.3},
+           {'beta': 0, 'gamma': 1.5, 'k': 0.5}]
+
+
+def reference_rows(config, run, n_steps, x, y, z):
+    """Rows of one iter_russell_simulation run, norm taken before the kick"""
+    X, _, _ = np.meshgrid(x, y, z)
+    profile = schitzoanalytic_profile(X)
+    dV = (x[1] - x[0]) * (y[1] - y[0]) * (z[1] - z[0])
+    rows = []
+    for snapshot in iter_russell_simulation(n_steps, x=x, y=y, z=z,
+                                            verbose=False, **config):
+        kick = SCHITZO_INTENSITY * SCHITZO_DECAY**snapshot.step * profile
+        evolved = snapshot.psi - kick
+        rows.append({'run': run, 'step': snapshot.step, 'time': snapshot.time,
+                     'entanglement_entropy': snapshot.entropy,
+                     'spin_orbit_energy': snapshot.so_energy,
+                     'norm': np.sqrt(np.sum(np.abs(evolved)**2) * dV)})
+    return rows
+
+
+@pytest.mark.parametrize('batch_size', [1, 2, None])
+def test_sweep_matches_single_runs(batch_size):
+    x, y, z = russell_grid(12)
+    rows = run_parameter_sweep(CONFIGS, n_steps=4, x=x, y=y, z=z,
+                               batch_size=batch_size, processes=1)
+    expected = [row for run, config in enumerate(CONFIGS)
+                for row in reference_rows(config, run, 4, x, y, z)]
+    assert len(rows) == len(expected)
+    for row, reference in zip(rows, expected):
+        for name, value in reference.items():
+            assert row[name] == pytest.approx(value, rel=1e-9, abs=1e-12), \
+                name
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from sparse_propagator import KrylovPropagator
+from split_operator import SplitOperatorPropagator
+
+
+def harmonic_setup(n=32, extent=6):
+    x = y = z = np.linspace(-extent, extent, n)
+    X, Y, Z = np.meshgrid(x, y, z)
+    V = 0.5 * (X**2 + Y**2 + Z**2)
+    psi = np.exp(-((X - 0.5)**2 + Y**2 + Z**2) / 2 + 0.5j * Y)
+    return (x, y, z), V, psi
+
+
+@pytest.mark.parametrize('propagator', [SplitOperatorPropagator,
+                                        KrylovPropagator])
+def test_norm_is_preserved(propagator):
+    axes, V, psi = harmonic_setup()
+    norm = np.linalg.norm(psi)
+    propagator(*axes, V, 0.01).step(psi, 50)
+    assert np.linalg.norm(psi) == pytest.approx(norm, rel=1e-10)
+
+
+def test_split_operator_agrees_with_krylov():
+    # Spectral vs second-order finite-difference kinetic energy: they agree
+    # to O(dx^2) for a state well inside the box
+    axes, V, psi = harmonic_setup()
+    split, krylov = psi.copy(), psi.copy()
+    SplitOperatorPropagator(*axes, V, 0.01).step(split, 50)
+    KrylovPropagator(*axes, V, 0.01).step(krylov, 50)
+    assert np.linalg.norm(split - krylov) < 0.03 * np.linalg.norm(psi)
+
+
+def test_fused_steps_match_single_steps():
+    axes, V, psi = harmonic_setup(n=16)
+    fused, single = psi.copy(), psi.copy()
+    propagator = SplitOperatorPropagator(*axes, V, 0.02)
+    propagator.step(fused, 10)
+    for _ in range(10):
+        propagator.step(single)
+    np.testing.assert_allclose(fused, single, atol=1e-12)
+
+
+def test_non_complex128_state_is_rejected():
+    axes, V, psi = harmonic_setup(n=8)
+    with pytest.raises(TypeError):
+        SplitOperatorPropagator(*axes, V, 0.01).step(psi.astype(np.complex64))
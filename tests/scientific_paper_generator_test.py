@@ -0,0 +1,104 @@
+import json
+import os
+import stat
+import sys
+
+import pytest
+
+import scientific_paper_generator as generator
+
+FAKE_DVIPNG = f"""#!{sys.executable}
+import sys
+from PIL import Image
+Image.new('L', (40, 12), 255).save(sys.argv[sys.argv.index('-o') + 1])
+"""
+
+
+def write_script(path, content):
+    path.write_text(content)
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+
+
+@pytest.fixture
+def toolchain(tmp_path, monkeypatch):
+    """Fake latex/dvipng on PATH; call it with working=False to break latex"""
+    bin_dir = tmp_path / 'bin'
+    bin_dir.mkdir()
+    write_script(bin_dir / 'dvipng', FAKE_DVIPNG)
+    monkeypatch.setenv('PATH', f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    def install(working=True):
+        write_script(bin_dir / 'latex',
+                     "#!/bin/sh\ntouch eq.dvi\n" if working else
+                     "#!/bin/sh\nexit 1\n")
+    return install
+
+
+@pytest.fixture
+def paper(tmp_path, monkeypatch):
+    monkeypatch.setattr(generator, 'FIGURE_CACHE_DIR', str(tmp_path / 'fig'))
+    monkeypatch.setattr(generator, 'EQUATION_CACHE_DIR', str(tmp_path / 'eq'))
+    return str(tmp_path / 'paper.pdf')
+
+
+def results():
+    return [generator.SimulationResult(run=i) for i in range(2)]
+
+
+def read_manifest(pdf_path):
+    with open(generator.manifest_path(pdf_path)) as f:
+        return json.load(f)
+
+
+def test_verification_rejects_a_foreign_manifest(toolchain, paper):
+    toolchain()
+    assert generator.generate_scientific_paper(results(), paper)
+    assert generator.verify_pdf_content(paper, 2, 2)
+    assert not generator.verify_pdf_content(paper, 3, 2)
+
+    manifest = read_manifest(paper)
+    manifest['citations'] += 1
+    with open(generator.manifest_path(paper), 'w') as f:
+        json.dump(manifest, f)
+    assert not generator.verify_pdf_content(paper, 2, 2)
+
+
+def test_failed_equation_is_rebuilt_once_latex_works(toolchain, paper,
+                                                     monkeypatch):
+    toolchain(working=False)
+    assert not generator.generate_scientific_paper(results(), paper)
+    assert read_manifest(paper)['build_key'] is None
+
+    toolchain(working=True)
+    assert generator.generate_scientific_paper(results(), paper)
+    assert read_manifest(paper)['build_key'] is not None
+
+    # Nothing changed: the keyed PDF is reused without being rebuilt
+    def embed_content(*args, **kwargs):
+        raise AssertionError("up-to-date paper was rebuilt")
+    monkeypatch.setattr(generator, 'embed_content', embed_content)
+    assert generator.generate_scientific_paper(results(), paper)
+
+
+def test_changed_equation_reuses_figures(toolchain, paper):
+    toolchain()
+    first = results()
+    assert generator.generate_scientific_paper(first, paper)
+    second = results()
+    second[0].equation = r"$E = \hbar \omega$"
+    assert [generator.figure_key(r) for r in first] == \
+        [generator.figure_key(r) for r in second]
+    key = read_manifest(paper)['build_key']
+    assert generator.generate_scientific_paper(second, paper)
+    assert read_manifest(paper)['build_key'] != key
+
+
+def test_cached_paper_failing_verification_is_rebuilt(toolchain, paper):
+    toolchain()
+    assert generator.generate_scientific_paper(results(), paper)
+    manifest = read_manifest(paper)
+    manifest['items'].pop()
+    with open(generator.manifest_path(paper), 'w') as f:
+        json.dump(manifest, f)
+    assert generator.generate_scientific_paper(results(), paper)
+    assert generator.verify_pdf_content(paper, 2, 2)